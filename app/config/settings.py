@@ -32,6 +32,15 @@ class DatabaseSettings:
     POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
     MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
 
+    # Cached health check (see app/db/health.py)
+    HEALTH_TTL_SECONDS: float = float(os.getenv("DB_HEALTH_TTL_SECONDS", 10))
+    HEALTH_FAILURE_THRESHOLD: int = int(os.getenv("DB_HEALTH_FAILURE_THRESHOLD", 3))
+    HEALTH_OPEN_SECONDS: float = float(os.getenv("DB_HEALTH_OPEN_SECONDS", 30))
+
+    # Batched metric/note persistence (see app/services/bulk_persistence.py)
+    BULK_BATCH_SIZE: int = int(os.getenv("DB_BULK_BATCH_SIZE", 1000))
+    BULK_METHOD: str = os.getenv("DB_BULK_METHOD", "insert").lower()  # insert | copy
+
     @property
     def url(self) -> str:
         return (
@@ -62,6 +71,19 @@ class FileSettings:
         os.getenv("ALLOWED_EXTENSIONS", "pdf,png,jpg,jpeg,tiff,bmp").split(",")
     )
 
+    # Content-addressed extraction cache (keyed by file SHA-256 + versions)
+    CACHE_ENABLED: bool = os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+    CACHE_DIR: Path = UPLOAD_DIR / ".extraction_cache"
+    CACHE_MAX_MB: int = int(os.getenv("EXTRACTION_CACHE_MAX_MB", 512))
+
+    # PDF pages with fewer PyMuPDF words are re-extracted with pdfplumber
+    PDF_FALLBACK_MIN_PAGE_WORDS: int = int(os.getenv("PDF_FALLBACK_MIN_PAGE_WORDS", 10))
+
+    # Background report processing queue
+    JOB_DIR: Path = UPLOAD_DIR / ".jobs"
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", 2))
+    JOB_RETENTION_HOURS: int = int(os.getenv("JOB_RETENTION_HOURS", 72))  # finished job records
+
     def __post_init__(self):
         self.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
         self.LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -72,7 +94,19 @@ class OCRSettings:
 
     TESSERACT_CMD: str = os.getenv("TESSERACT_CMD", "/usr/bin/tesseract")
     LANGUAGE: str = os.getenv("OCR_LANGUAGE", "eng")
-    ENGINE: str = os.getenv("OCR_ENGINE", "tesseract")  # tesseract | easyocr
+    ENGINE: str = os.getenv("OCR_ENGINE", "tesseract")  # tesseract | tesserocr | easyocr
+    TESSDATA_DIR: str = os.getenv("TESSDATA_PREFIX", "")  # tesserocr only; empty = library default
+    WORKERS: int = int(os.getenv("OCR_WORKERS", 1))     # >1 = process pool for PDF pages
+    EASYOCR_POOL_SIZE: int = int(os.getenv("EASYOCR_POOL_SIZE", 2))  # cached readers (language sets)
+    EASYOCR_WARM_START: bool = os.getenv("EASYOCR_WARM_START", "false").lower() == "true"
+    HYBRID_PDF: bool = os.getenv("OCR_HYBRID_PDF", "false").lower() == "true"  # OCR sparse pages only
+    HYBRID_MIN_PAGE_WORDS: int = int(os.getenv("OCR_HYBRID_MIN_PAGE_WORDS", 20))
+    DPI: int = int(os.getenv("OCR_DPI", 300))                          # PDF page render resolution
+    ADAPTIVE_DPI: bool = os.getenv("OCR_ADAPTIVE_DPI", "false").lower() == "true"
+    ADAPTIVE_LOW_DPI: int = int(os.getenv("OCR_ADAPTIVE_LOW_DPI", 150))  # first pass when adaptive
+    ADAPTIVE_MIN_CONFIDENCE: float = float(os.getenv("OCR_ADAPTIVE_MIN_CONFIDENCE", 75))  # re-render below
+    SKIP_BLANK_PAGES: bool = os.getenv("OCR_SKIP_BLANK_PAGES", "false").lower() == "true"
+    BLANK_INK_THRESHOLD: float = float(os.getenv("OCR_BLANK_INK_THRESHOLD", 0.001))  # dark-pixel share
 
 
 class LogSettings:
@@ -9,9 +9,10 @@ ML-based classification is added in Week 3-4.
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from app.utils.logger import logger
+from app.utils.timing import incr_counter, record_stage
 from app.utils.text_utils import (
     clean_text,
     extract_numeric_value,
@@ -20,6 +21,24 @@ from app.utils.text_utils import (
     truncate,
 )
 
+if TYPE_CHECKING:
+    from app.core.pdf_document import PageText
+
+try:  # CPython's regex parser; only used to derive the scanner's start class
+    import re._constants as sre_constants
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    try:
+        import sre_constants
+        import sre_parse
+    except ImportError:
+        sre_constants = sre_parse = None
+
+
+# Bump whenever patterns, reference ranges or note heuristics change;
+# part of the extraction cache key.
+EXTRACTOR_VERSION = "1"
+
 
 # ─── Data Classes ─────────────────────────────────────────────────────────────
 @dataclass
@@ -44,6 +63,26 @@ class ExtractedNote:
     section_heading: str = ""
 
 
+@dataclass
+class ParsedReport:
+    """
+    Per-report preprocessing shared by every extraction stage.
+    Built once with ParsedReport.from_text(), so the section map is split a
+    single time however many stages read it.
+    """
+    text: str
+    sections: dict[str, str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "ParsedReport":
+        return cls(text=text, sections=split_into_sections(text))
+
+
+def _as_parsed(text: Union[str, ParsedReport]) -> ParsedReport:
+    """Accept raw text or an already-built ParsedReport."""
+    return text if isinstance(text, ParsedReport) else ParsedReport.from_text(text)
+
+
 @dataclass
 class ExtractionResult:
     """Complete result from data extraction on one report's text."""
@@ -153,78 +192,307 @@ DOCTOR_NOTE_KEYWORDS = [
 
 
 # ─── Metric Extraction ────────────────────────────────────────────────────────
+# Values this far outside the range are critical rather than low/high
+CRITICAL_LOW_FACTOR = 0.8
+CRITICAL_HIGH_FACTOR = 1.5
+
+
 def _compute_status(
     value: float,
     ref_min: Optional[float],
     ref_max: Optional[float],
 ) -> str:
-    """Classify a value against its reference range."""
+    """
+    Classify a value against its reference range.
+    Bulk counterpart: app.core.range_classifier.classify_values().
+    """
     if ref_min is None or ref_max is None:
         return "unknown"
-    if value < ref_min * 0.8:
+    if value < ref_min * CRITICAL_LOW_FACTOR:
         return "critical"
     if value < ref_min:
         return "low"
-    if value > ref_max * 1.5:
+    if value > ref_max * CRITICAL_HIGH_FACTOR:
         return "critical"
     if value > ref_max:
         return "high"
     return "normal"
 
 
-def extract_metrics(text: str) -> list[ExtractedMetric]:
+def _first_chars(items) -> tuple[Optional[set[str]], bool]:
     """
-    Scan the extracted text for known health metric patterns.
-    Returns a deduplicated list of ExtractedMetric objects.
+    Collect the characters a parsed regex can start with.
+
+    Returns (chars, nullable). chars is None when the start cannot be bounded
+    to a small literal set (wildcards, negated classes, unknown opcodes).
+    """
+    chars: set[str] = set()
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            item_chars, nullable = {chr(av)}, False
+        elif op == sre_constants.IN:
+            item_chars, nullable = set(), False
+            for set_op, set_av in av:
+                if set_op == sre_constants.LITERAL:
+                    item_chars.add(chr(set_av))
+                elif set_op == sre_constants.RANGE and set_av[1] - set_av[0] < 64:
+                    item_chars.update(chr(c) for c in range(set_av[0], set_av[1] + 1))
+                elif set_op == sre_constants.CATEGORY and set_av == sre_constants.CATEGORY_DIGIT:
+                    item_chars.update("0123456789")
+                else:
+                    return None, False
+        elif op == sre_constants.SUBPATTERN:
+            item_chars, nullable = _first_chars(av[-1])
+        elif op == sre_constants.BRANCH:
+            item_chars, nullable = set(), False
+            for branch in av[1]:
+                branch_chars, branch_nullable = _first_chars(branch)
+                if branch_chars is None:
+                    return None, False
+                item_chars |= branch_chars
+                nullable = nullable or branch_nullable
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            item_chars, nullable = _first_chars(av[2])
+            nullable = nullable or av[0] == 0
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            item_chars, nullable = set(), True
+        else:
+            return None, False
+
+        if item_chars is None:
+            return None, False
+        chars |= item_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _pattern_start_chars(pattern: str) -> Optional[set[str]]:
+    """
+    Characters a match of pattern can start with, or None when that cannot
+    be bounded. The regex parser is a CPython internal, so when it is missing
+    or its output is not understood the scanner just loses its prefilter and
+    tries every position instead.
     """
-    metrics: list[ExtractedMetric] = []
-    seen_keys: set[str] = set()
-    text_lower = text.lower()
+    if sre_parse is None:
+        return None
+    try:
+        chars, nullable = _first_chars(sre_parse.parse(pattern, re.IGNORECASE))
+    except Exception as exc:
+        logger.debug(f"No start-character prefilter for {pattern!r}: {exc}")
+        return None
+    return None if nullable else chars
+
+
+def _compile_metric_scanner(
+    patterns: list[tuple[str, str, str]],
+) -> tuple[Optional[re.Pattern], list[tuple[str, str, int, int]]]:
+    """
+    Fold the metric pattern table into one combined matcher.
 
-    for metric_key, metric_name, pattern in METRIC_PATTERNS:
-        if metric_key in seen_keys:
-            continue
+    The scanner consumes one candidate start character (a class built from
+    the patterns' possible first characters, which the regex engine can skip
+    to quickly). A fixed-width lookbehind then steps back over that character
+    and runs every pattern as a lookahead from it, so all metrics matching at
+    a position are captured there, including overlapping ones such as
+    systolic/diastolic BP.
 
+    Returns the compiled scanner and, per metric, (metric_key, metric_name,
+    group offset of the whole match, number of inner capture groups).
+    """
+    valid: list[tuple[str, str, str, int]] = []
+    start_chars: Optional[set[str]] = set()
+    for metric_key, metric_name, pattern in patterns:
         try:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            inner_groups = re.compile(pattern, re.IGNORECASE).groups
         except re.error as exc:
             logger.warning(f"Regex error for {metric_key}: {exc}")
             continue
+        valid.append((metric_key, metric_name, pattern, inner_groups))
+
+        chars = _pattern_start_chars(pattern) if start_chars is not None else None
+        start_chars = None if chars is None else start_chars | chars
+
+    if not valid:
+        return None, []
+
+    # The leading guard re-uses the raw patterns, so its capture groups come
+    # first in the numbering; per-metric captures start after them.
+    alternatives: list[str] = []
+    captures: list[str] = []
+    layout: list[tuple[str, str, int, int]] = []
+    group_offset = 1 + sum(inner_groups for *_, inner_groups in valid)
+
+    for metric_key, metric_name, pattern, inner_groups in valid:
+        alternatives.append(f"(?:{pattern})")
+        captures.append(f"(?:(?<=(?=({pattern}))[\\s\\S])|)")
+        layout.append((metric_key, metric_name, group_offset, inner_groups))
+        group_offset += 1 + inner_groups
+
+    start_class = (
+        "[" + "".join(re.escape(c) for c in sorted(start_chars)) + "]"
+        if start_chars else r"[\s\S]"
+    )
+    combined = (
+        start_class
+        + f"(?<=(?={'|'.join(alternatives)})[\\s\\S])"
+        + "".join(captures)
+    )
+    return re.compile(combined, re.IGNORECASE), layout
+
+
+# Compiled once at import; extract_metrics() scans the text a single time.
+_METRIC_SCANNER, _METRIC_LAYOUT = _compile_metric_scanner(METRIC_PATTERNS)
+_METRIC_REGEXES: dict[str, re.Pattern] = {
+    metric_key: re.compile(pattern, re.IGNORECASE)
+    for (metric_key, _name, pattern) in METRIC_PATTERNS
+    if metric_key in {key for key, *_ in _METRIC_LAYOUT}
+}
 
-        for match in matches:
-            raw_snippet = truncate(match.group(0), 120)
-            raw_value_str = match.group(1) if match.lastindex and match.lastindex >= 1 else ""
-            value = extract_numeric_value(raw_value_str)
+# Up to this many characters one re.finditer per pattern is faster than the
+# combined scanner: each pattern stops at its first usable match, while the
+# scanner runs every lookahead at each candidate position.
+PER_PATTERN_MAX_CHARS = 1000
+
+
+def _build_metric(
+    metric_key: str,
+    metric_name: str,
+    match: re.Match,
+    offset: int,
+    inner_groups: int,
+) -> Optional[ExtractedMetric]:
+    """Turn one scanner capture into an ExtractedMetric (None if no usable value)."""
+    raw_snippet = truncate(match.group(offset), 120)
+    raw_value_str = (match.group(offset + 1) or "") if inner_groups >= 1 else ""
+    value = extract_numeric_value(raw_value_str)
+
+    if value is None:
+        return None
+
+    # Unit: use captured group 2 if available, else use reference default
+    ref = REFERENCE_RANGES.get(metric_key)
+    captured_unit = ""
+    if inner_groups >= 2:
+        captured_unit = (match.group(offset + 2) or "").strip()
+    unit = normalize_unit(captured_unit) if captured_unit else (ref[2] if ref else "")
+
+    ref_min = ref[0] if ref else None
+    ref_max = ref[1] if ref else None
+    status = _compute_status(value, ref_min, ref_max)
+
+    return ExtractedMetric(
+        metric_name=metric_name,
+        metric_key=metric_key,
+        value=value,
+        unit=unit,
+        reference_min=ref_min,
+        reference_max=ref_max,
+        status=status,
+        raw_text_snippet=raw_snippet,
+        confidence=0.85,  # Rule-based confidence; updated by ML in Week 3-4
+    )
+
+
+def _scan_each_pattern(
+    text: str,
+    found: dict[str, ExtractedMetric],
+    pos: int = 0,
+    resume_at: Optional[dict[str, int]] = None,
+) -> int:
+    """
+    Per-pattern counterpart of the combined scanner: one re.finditer per
+    unresolved metric from pos (or its resume_at offset), stopping at its
+    first usable match. Returns the offset where scanning stopped (len(text)
+    if any metric is still unresolved).
+    """
+    resume_at = resume_at or {}
+    scanned = pos
+    for metric_key, metric_name, *_ in _METRIC_LAYOUT:
+        if metric_key in found:
+            continue
+        regex = _METRIC_REGEXES[metric_key]
+        for match in regex.finditer(text, max(pos, resume_at.get(metric_key, 0))):
+            metric = _build_metric(metric_key, metric_name, match, 0, regex.groups)
+            if metric is not None:
+                found[metric_key] = metric
+                scanned = max(scanned, match.end())
+                break
+        else:
+            scanned = len(text)
+    return scanned
+
+
+def _scan_metrics(text: str, found: dict[str, ExtractedMetric]) -> int:
+    """
+    Add the first usable match of every metric_key not already in found.
+
+    Short texts are scanned per pattern (PER_PATTERN_MAX_CHARS). Longer ones
+    start with the combined scanner, which is cheapest while most metrics are
+    unresolved (a header or narrative before the lab panel, or a text with
+    few metrics at all); once a quarter of them are resolved, the rest of the
+    text is scanned one remaining pattern at a time from the current offset.
+    Returns the offset where scanning stopped (len(text) if any metric is
+    still unresolved).
+    """
+    remaining = sum(1 for metric_key, *_ in _METRIC_LAYOUT if metric_key not in found)
+    if not remaining:
+        return 0
+    finish_at = len(_METRIC_LAYOUT) * 3 // 4
+    if len(text) <= PER_PATTERN_MAX_CHARS or remaining <= finish_at:
+        return _scan_each_pattern(text, found)
+
+    # A rejected match blocks its own span, mirroring re.finditer's
+    # non-overlapping semantics for the per-pattern scan.
+    resume_at: dict[str, int] = {}
+
+    for match in _METRIC_SCANNER.finditer(text):
+        start = match.start()
+        for metric_key, metric_name, offset, inner_groups in _METRIC_LAYOUT:
+            if metric_key in found or match.group(offset) is None:
+                continue
+            if start < resume_at.get(metric_key, 0):
+                continue
 
-            if value is None:
+            metric = _build_metric(metric_key, metric_name, match, offset, inner_groups)
+            if metric is None:
+                resume_at[metric_key] = match.end(offset)
                 continue
+            found[metric_key] = metric
+            remaining -= 1
 
-            # Unit: use captured group 2 if available, else use reference default
-            ref = REFERENCE_RANGES.get(metric_key)
-            captured_unit = ""
-            if match.lastindex and match.lastindex >= 2:
-                captured_unit = (match.group(2) or "").strip()
-            unit = normalize_unit(captured_unit) if captured_unit else (ref[2] if ref else "")
-
-            ref_min = ref[0] if ref else None
-            ref_max = ref[1] if ref else None
-            status = _compute_status(value, ref_min, ref_max)
-
-            metrics.append(
-                ExtractedMetric(
-                    metric_name=metric_name,
-                    metric_key=metric_key,
-                    value=value,
-                    unit=unit,
-                    reference_min=ref_min,
-                    reference_max=ref_max,
-                    status=status,
-                    raw_text_snippet=raw_snippet,
-                    confidence=0.85,  # Rule-based confidence; updated by ML in Week 3-4
-                )
-            )
-            seen_keys.add(metric_key)
-            break  # Take only first match per metric
+        if not remaining:
+            return match.end()
+        if remaining <= finish_at:
+            # The scanner consumes one character per match, so every position
+            # before match.end() has already been tried for every pattern
+            return _scan_each_pattern(text, found, match.end(), resume_at)
+    return len(text)
+
+
+def _ordered_metrics(found: dict[str, ExtractedMetric]) -> list[ExtractedMetric]:
+    return [found[key] for key, *_ in _METRIC_LAYOUT if key in found]
+
+
+def extract_metrics(text: Union[str, ParsedReport]) -> list[ExtractedMetric]:
+    """
+    Scan the extracted text for known health metric patterns.
+    Returns a deduplicated list of ExtractedMetric objects.
+
+    Longer texts are matched in a single pass with the combined scanner,
+    short ones one pattern at a time. The first usable match per metric_key
+    wins, and results keep the METRIC_PATTERNS order.
+    """
+    if _METRIC_SCANNER is None:
+        return []
+
+    if isinstance(text, ParsedReport):
+        text = text.text
+
+    found: dict[str, ExtractedMetric] = {}
+    scanned = _scan_metrics(text, found)
+    incr_counter("extract.metric_chars_skipped", len(text) - scanned)
+    metrics = _ordered_metrics(found)
 
     logger.info(f"Extracted {len(metrics)} health metrics from text.")
     return metrics
@@ -243,12 +511,12 @@ def _classify_note_type(section_heading: str, content: str) -> str:
     return "general"
 
 
-def extract_textual_notes(text: str) -> list[ExtractedNote]:
+def extract_textual_notes(text: Union[str, ParsedReport]) -> list[ExtractedNote]:
     """
     Extract meaningful textual blocks from the report.
     Sections with doctor notes, diagnoses, or prescriptions are returned.
     """
-    sections = split_into_sections(text)
+    sections = _as_parsed(text).sections
     notes: list[ExtractedNote] = []
 
     # Note-relevant section headings
@@ -262,11 +530,12 @@ def extract_textual_notes(text: str) -> list[ExtractedNote]:
             continue
 
         # Include section if it matches known note sections OR contains keywords
+        content_lower = content.lower()
         heading_match = any(key in heading.upper() for key in note_section_keys)
-        content_match = any(kw in content.lower() for kw in DOCTOR_NOTE_KEYWORDS)
+        content_match = any(kw in content_lower for kw in DOCTOR_NOTE_KEYWORDS)
 
         if heading_match or content_match:
-            note_type = _classify_note_type(heading, content)
+            note_type = _classify_note_type(heading, content_lower)
             notes.append(
                 ExtractedNote(
                     note_type=note_type,
@@ -280,26 +549,136 @@ def extract_textual_notes(text: str) -> list[ExtractedNote]:
 
 
 # ─── Main Entry Point ─────────────────────────────────────────────────────────
-def extract_data_from_text(raw_text: str) -> ExtractionResult:
+def extract_data_from_text(raw_text: Union[str, ParsedReport]) -> ExtractionResult:
     """
     Orchestrate full data extraction from raw report text.
 
     Args:
-        raw_text: The cleaned text extracted via OCR or PDF parser.
+        raw_text: The cleaned text extracted via OCR or PDF parser
+                  (or a ParsedReport built from it).
 
     Returns:
         ExtractionResult containing metrics and notes.
     """
-    if not raw_text or not raw_text.strip():
+    text = raw_text.text if isinstance(raw_text, ParsedReport) else raw_text
+    if not text or not text.strip():
         logger.warning("extract_data_from_text received empty text.")
         return ExtractionResult()
 
-    sections = split_into_sections(raw_text)
-    metrics = extract_metrics(raw_text)
-    notes = extract_textual_notes(raw_text)
+    # Preprocess once; every stage reads from the same ParsedReport
+    with record_stage("extract.preprocess"):
+        report = _as_parsed(raw_text)
+    with record_stage("extract.metrics"):
+        metrics = extract_metrics(report)
+    with record_stage("extract.notes"):
+        notes = extract_textual_notes(report)
 
     return ExtractionResult(
         metrics=metrics,
         notes=notes,
-        sections_found=list(sections.keys()),
-    )
\ No newline at end of file
+        sections_found=list(report.sections.keys()),
+    )
+
+
+# ─── Streaming ────────────────────────────────────────────────────────────────
+class StreamingExtractor:
+    """
+    Incremental, page-ordered counterpart of extract_data_from_text for page
+    streams (iter_pdf_pages / iter_ocr_pages, or a result's page_texts).
+
+    Metrics are resolved page by page, so metrics_so_far can drive progress
+    display before the document is finished. Each page is scanned only for
+    metrics still unresolved, and the metric pass stops entirely once every
+    METRIC_PATTERNS key is resolved; skipped text is counted in
+    chars_skipped / pages_skipped and the extract.metric_* counters.
+
+    A page is scanned once the next one arrives (or in result()), with the
+    same separator raw_text uses, so results match a scan of the joined text
+    except for a match split across a page break (label on one page, value
+    on the next). Stored reports are extracted with extract_data_from_text,
+    so use this only where live per-page results matter more than that
+    edge case. Notes need the section layout of the whole document (a
+    section may continue across pages), so page texts are kept until
+    result() is called.
+    """
+
+    def __init__(self) -> None:
+        self._found: dict[str, ExtractedMetric] = {}
+        self._pages: list[str] = []
+        self.chars_scanned = 0
+        self.chars_skipped = 0
+        self.pages_skipped = 0
+
+    def _scan_page(self, text: str) -> None:
+        if _METRIC_SCANNER is None or len(self._found) == len(_METRIC_LAYOUT):
+            self.chars_skipped += len(text)
+            self.pages_skipped += 1
+            return
+
+        with record_stage("extract.metrics"):
+            scanned = _scan_metrics(text, self._found)
+        self.chars_scanned += scanned
+        self.chars_skipped += len(text) - scanned
+
+    def feed(self, page: Union[str, "PageText"]) -> list[ExtractedMetric]:
+        """Consume one page; returns metrics newly resolved by the previous page."""
+        text = page if isinstance(page, str) else page.text
+        if not text:
+            return []
+
+        before = set(self._found)
+        if self._pages:
+            self._scan_page(self._pages[-1] + "\n\n")
+        self._pages.append(text)
+        return [m for key, m in self._found.items() if key not in before]
+
+    @property
+    def metrics_so_far(self) -> list[ExtractedMetric]:
+        return _ordered_metrics(self._found)
+
+    def result(self) -> ExtractionResult:
+        """Finish the document: notes over the full text plus the collected metrics."""
+        if self._pages:
+            self._scan_page(self._pages[-1])
+        incr_counter("extract.metric_chars_scanned", self.chars_scanned)
+        incr_counter("extract.metric_chars_skipped", self.chars_skipped)
+        incr_counter("extract.metric_pages_skipped", self.pages_skipped)
+
+        text = "\n\n".join(self._pages)
+        self._pages = []
+        if not text.strip():
+            logger.warning("StreamingExtractor received no text.")
+            return ExtractionResult()
+
+        with record_stage("extract.preprocess"):
+            report = ParsedReport.from_text(text)
+        with record_stage("extract.notes"):
+            notes = extract_textual_notes(report)
+
+        metrics = self.metrics_so_far
+        logger.info(
+            f"Extracted {len(metrics)} health metrics from page stream "
+            f"({self.chars_skipped} chars skipped)."
+        )
+        return ExtractionResult(
+            metrics=metrics,
+            notes=notes,
+            sections_found=list(report.sections.keys()),
+        )
+
+
+def extract_data_from_pages(pages: Iterable[Union[str, "PageText"]]) -> ExtractionResult:
+    """
+    Streaming counterpart of extract_data_from_text.
+
+        result = extract_data_from_pages(iter_ocr_pages(document))
+
+    Pages are consumed one at a time from any iterable of strings or
+    PageText objects. A metric split across a page break is not found (see
+    StreamingExtractor); for an already-parsed document extract_data_from_text
+    on its raw_text is exact and just as fast.
+    """
+    extractor = StreamingExtractor()
+    for page in pages:
+        extractor.feed(page)
+    return extractor.result()
@@ -2,17 +2,29 @@
 OCR Engine Module.
 Extracts text from scanned images and image-based PDFs.
 
-Primary engine:  Tesseract (via pytesseract)
+Primary engine:  Tesseract (via pytesseract, or in-process via tesserocr)
 Fallback engine: EasyOCR (deep-learning based, better for noisy scans)
 """
 
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, NamedTuple, Optional, Union
 
 from app.config.settings import ocr_settings
+from app.core.pdf_document import PageText, PDFDocument, as_document
 from app.utils.logger import logger
 from app.utils.text_utils import clean_text, count_words
+from app.utils.timing import current_timings, incr_counter, record_stage, timing_scope
+
+
+# Bump whenever OCR output changes; part of the extraction cache key.
+OCR_VERSION = "3"
 
 
 @dataclass
@@ -25,33 +37,137 @@ class OCRResult:
     word_count: int = 0
     confidence: float = 0.0     # Average confidence (0–100)
     engine_used: str = ""
+    page_dpi: dict[str, int] = field(default_factory=dict)  # render DPI per OCR'd PDF page
+    skipped_pages: dict[str, str] = field(default_factory=dict)  # page key → skip reason
+    pages_skipped: int = 0
     error: Optional[str] = None
 
 
 # ─── Tesseract ────────────────────────────────────────────────────────────────
+def _text_from_tesseract_data(data: dict) -> str:
+    """
+    Rebuild page text from Tesseract's word-level layout data.
+    Words are joined by spaces, lines by newlines and paragraphs/blocks by a
+    blank line, mirroring the layout of image_to_string output.
+    """
+    paragraphs: list[str] = []
+    lines: list[str] = []
+    words: list[str] = []
+    current_par: Optional[tuple[int, int]] = None
+    current_line: Optional[tuple[int, int, int]] = None
+
+    for level, block, par, line, word in zip(
+        data["level"], data["block_num"], data["par_num"], data["line_num"], data["text"]
+    ):
+        word = str(word).strip()
+        if level != 5 or not word:
+            continue
+
+        line_key = (block, par, line)
+        if line_key != current_line:
+            if words:
+                lines.append(" ".join(words))
+                words = []
+            if (block, par) != current_par:
+                if lines:
+                    paragraphs.append("\n".join(lines))
+                    lines = []
+                current_par = (block, par)
+            current_line = line_key
+        words.append(word)
+
+    if words:
+        lines.append(" ".join(words))
+    if lines:
+        paragraphs.append("\n".join(lines))
+
+    return "\n\n".join(paragraphs)
+
+
+def _pytesseract_image(img) -> tuple[str, list[float]]:
+    """
+    Run the tesseract CLI once on an image.
+    A single image_to_data call yields both the text (rebuilt from the
+    word/line/block structure) and the per-word confidences.
+    """
+    import pytesseract
+
+    pytesseract.pytesseract.tesseract_cmd = ocr_settings.TESSERACT_CMD
+    data = pytesseract.image_to_data(
+        img, lang=ocr_settings.LANGUAGE, output_type=pytesseract.Output.DICT
+    )
+    confidences = [
+        c for c in data["conf"] if isinstance(c, (int, float)) and c >= 0
+    ]
+    return _text_from_tesseract_data(data), confidences
+
+
+# ─── Tesserocr (persistent API) ───────────────────────────────────────────────
+# pytesseract spawns a tesseract process per call and reloads traineddata each
+# time. With OCR_ENGINE=tesserocr every thread (and so every pool worker)
+# keeps one initialised TessBaseAPI and feeds it in-memory PIL images.
+_tesserocr_local = threading.local()
+_tesserocr_unavailable = False
+
+
+def _get_tesserocr_api() -> Any:
+    """Return this thread's long-lived tesserocr API. Raises ImportError if missing."""
+    api = getattr(_tesserocr_local, "api", None)
+    if api is None:
+        import tesserocr
+
+        kwargs = {"lang": ocr_settings.LANGUAGE}
+        if ocr_settings.TESSDATA_DIR:
+            kwargs["path"] = ocr_settings.TESSDATA_DIR
+        logger.info(f"Initialising tesserocr API (lang={ocr_settings.LANGUAGE})")
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+        _tesserocr_local.api = api
+    return api
+
+
+def _tesserocr_image(img) -> tuple[str, list[float]]:
+    """Recognise an image with the thread's persistent API."""
+    api = _get_tesserocr_api()
+    api.SetImage(img)
+    api.Recognize()
+    text = api.GetUTF8Text()
+    confidences = [float(c) for c in api.AllWordConfidences() if c >= 0]
+    api.Clear()
+    return text, confidences
+
+
+def _tesseract_image(img) -> tuple[str, list[float]]:
+    """
+    Run Tesseract once on an image, returning (text, word_confidences).
+    Uses the persistent tesserocr backend when OCR_ENGINE=tesserocr and it
+    is installed, otherwise the pytesseract CLI wrapper.
+    """
+    global _tesserocr_unavailable
+
+    incr_counter("ocr.tesseract_calls")
+    with record_stage("ocr.tesseract"):
+        if ocr_settings.ENGINE.lower() == "tesserocr" and not _tesserocr_unavailable:
+            try:
+                return _tesserocr_image(img)
+            except ImportError:
+                _tesserocr_unavailable = True
+                logger.warning("tesserocr not installed, falling back to pytesseract.")
+                incr_counter("ocr.fallbacks")
+        return _pytesseract_image(img)
+
+
 def run_tesseract(image_path: Path) -> OCRResult:
     """
     Run Tesseract OCR on a single image file.
     Returns extracted text with average confidence score.
     """
     try:
-        import pytesseract
         from PIL import Image
 
-        pytesseract.pytesseract.tesseract_cmd = ocr_settings.TESSERACT_CMD
-
-        img = Image.open(str(image_path))
-
-        # Extract text
-        text = pytesseract.image_to_string(img, lang=ocr_settings.LANGUAGE)
-
-        # Extract confidence data
-        data = pytesseract.image_to_data(
-            img, lang=ocr_settings.LANGUAGE, output_type=pytesseract.Output.DICT
-        )
-        confidences = [
-            c for c in data["conf"] if isinstance(c, (int, float)) and c >= 0
-        ]
+        with record_stage("ocr.load_image"):
+            img = Image.open(str(image_path))
+            img.load()
+        text, confidences = _tesseract_image(img)
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
         cleaned = clean_text(text)
@@ -74,55 +190,328 @@ def run_tesseract(image_path: Path) -> OCRResult:
         return OCRResult(success=False, error=str(exc))
 
 
-def run_tesseract_on_pdf(pdf_path: Path) -> OCRResult:
+_PIXMAP_MODES = {1: "L", 3: "RGB", 4: "RGBA"}
+
+
+def _pixmap_to_image(pix):
     """
-    Convert each PDF page to an image and run Tesseract on each page.
-    Used when the PDF is scanned (no embedded text).
+    Wrap a PyMuPDF pixmap's raw samples as a PIL image without a PNG round trip.
+    The image shares the pixmap buffer, so keep the pixmap alive while using it.
     """
-    try:
-        import fitz  # PyMuPDF
-        import pytesseract
-        from PIL import Image
+    from PIL import Image
+
+    mode = _PIXMAP_MODES.get(pix.n)
+    if mode is None:
         import io
+        return Image.open(io.BytesIO(pix.tobytes("png")))
+
+    return Image.frombuffer(
+        mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+    )
+
+
+def _average(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
 
-        pytesseract.pytesseract.tesseract_cmd = ocr_settings.TESSERACT_CMD
-        doc = fitz.open(str(pdf_path))
+def _ocr_page_at(page, matrix) -> tuple[str, list[float]]:
+    """Render one PDF page with a prebuilt render matrix and OCR it."""
+    with record_stage("ocr.render"):
+        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        img = _pixmap_to_image(pix)
+    incr_counter("ocr.pages_rendered")
+    return _tesseract_image(img)
 
+
+# Blank-page check renders a grayscale thumbnail at this resolution
+_INK_CHECK_DPI = 50
+_INK_DARK_LEVEL = 160   # gray level below which a pixel counts as ink
+
+
+def _render_matrices() -> dict[int, Any]:
+    """
+    PyMuPDF render matrices for every DPI a run can use (full, adaptive
+    first pass, ink check), built once per run rather than per page.
+    """
+    import fitz  # PyMuPDF
+
+    dpis = {ocr_settings.DPI, ocr_settings.ADAPTIVE_LOW_DPI, _INK_CHECK_DPI}
+    return {dpi: fitz.Matrix(dpi / 72, dpi / 72) for dpi in dpis}
+
+
+def _ink_density(page, matrix) -> Optional[float]:
+    """
+    Share of dark pixels on a low-resolution grayscale render of the page.
+    Returns None when NumPy is unavailable (the page is then always OCR'd).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    import fitz  # PyMuPDF
+
+    with record_stage("ocr.ink_check"):
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
+        if not pix.width or not pix.height:
+            return 0.0
+        gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+        gray = gray[:, :pix.width]
+        return float(np.count_nonzero(gray < _INK_DARK_LEVEL)) / gray.size
+
+
+class _PageOCR(NamedTuple):
+    """OCR output for one PDF page, as yielded by _iter_page_ocr."""
+    page_num: int
+    text: str
+    confidences: list[float]
+    dpi: int                            # 0 when skipped
+    skip_reason: Optional[str] = None
+
+
+def _iter_page_ocr(
+    document: PDFDocument,
+    page_numbers: list[int],
+    cache: bool = True,
+    matrices: Optional[dict[int, Any]] = None,
+) -> Iterator[_PageOCR]:
+    """
+    Render and OCR PDF pages one at a time from an open document session.
+
+    With OCRSettings.SKIP_BLANK_PAGES, pages whose ink density is below
+    BLANK_INK_THRESHOLD (cover sheets, blank backs, separators) are not sent
+    to Tesseract at all.
+
+    With OCRSettings.ADAPTIVE_DPI each page is first OCR'd at
+    ADAPTIVE_LOW_DPI and re-rendered at OCRSettings.DPI only when its average
+    word confidence is below ADAPTIVE_MIN_CONFIDENCE.
+    """
+    matrices = matrices or _render_matrices()
+    full_dpi = ocr_settings.DPI
+    adaptive = ocr_settings.ADAPTIVE_DPI and ocr_settings.ADAPTIVE_LOW_DPI < full_dpi
+
+    for page_num in page_numbers:
+        page = document.page(page_num, cache=cache)
+
+        if ocr_settings.SKIP_BLANK_PAGES:
+            density = _ink_density(page, matrices[_INK_CHECK_DPI])
+            if density is not None and density < ocr_settings.BLANK_INK_THRESHOLD:
+                incr_counter("ocr.blank_pages_skipped")
+                yield _PageOCR(page_num, "", [], 0, f"blank (ink {density:.2%})")
+                continue
+
+        if adaptive:
+            dpi = ocr_settings.ADAPTIVE_LOW_DPI
+            text, confidences = _ocr_page_at(page, matrices[dpi])
+            if _average(confidences) < ocr_settings.ADAPTIVE_MIN_CONFIDENCE:
+                incr_counter("ocr.dpi_retries")
+                dpi = full_dpi
+                text, confidences = _ocr_page_at(page, matrices[dpi])
+        else:
+            dpi = full_dpi
+            text, confidences = _ocr_page_at(page, matrices[dpi])
+        yield _PageOCR(page_num, text, confidences, dpi)
+
+
+# ─── PDF Page Pool ────────────────────────────────────────────────────────────
+# One process-wide pool, created on first use with the "spawn" start method
+# (never forked from the multi-threaded Streamlit / job-queue process). Workers
+# outlive single documents, so their tesserocr API and render matrices are
+# loaded once; each keeps its last few documents open, keyed per OCR run.
+_ocr_pool: Any = None
+_ocr_pool_lock = threading.Lock()
+
+_WORKER_DOCUMENT_CACHE = 2
+_worker_documents: "OrderedDict[str, PDFDocument]" = OrderedDict()
+_worker_matrices: Optional[dict[int, Any]] = None
+
+
+def _get_ocr_pool() -> Any:
+    """Return the shared OCR process pool, creating it on first use."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=max(1, ocr_settings.WORKERS),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started OCR process pool with {ocr_settings.WORKERS} workers")
+        return _ocr_pool
+
+
+def shutdown_ocr_pool() -> None:
+    """Stop the shared OCR pool (it is recreated on the next pooled run)."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _worker_document(run_key: str, path: str) -> PDFDocument:
+    document = _worker_documents.get(run_key)
+    if document is None:
+        document = PDFDocument(path)
+        _worker_documents[run_key] = document
+        while len(_worker_documents) > _WORKER_DOCUMENT_CACHE:
+            _, evicted = _worker_documents.popitem(last=False)
+            evicted.close()
+    else:
+        _worker_documents.move_to_end(run_key)
+    return document
+
+
+def _ocr_page_worker(run_key: str, path: str, page_num: int) -> tuple[_PageOCR, dict]:
+    """Pool entry point: OCR one page plus the worker's stage timings."""
+    global _worker_matrices
+    with timing_scope() as timings:
+        if _worker_matrices is None:
+            _worker_matrices = _render_matrices()
+        document = _worker_document(run_key, path)
+        page = next(_iter_page_ocr(
+            document, [page_num], cache=False, matrices=_worker_matrices
+        ))
+    return page, timings.to_dict()
+
+
+@contextmanager
+def _pool_source(document: PDFDocument) -> Iterator[tuple[str, str]]:
+    """
+    (run_key, path) for pool workers. In-memory uploads are written to a
+    temporary file once, so the PDF is not pickled along with every page.
+    """
+    run_key = uuid.uuid4().hex
+    if document.path is not None:
+        yield run_key, str(document.path)
+        return
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(document.data)
+        yield run_key, tmp_name
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def _select_pages(page_count: int, page_numbers: Optional[list[int]]) -> list[int]:
+    if page_numbers is None:
+        return list(range(page_count))
+    return sorted(n for n in set(page_numbers) if 0 <= n < page_count)
+
+
+def _iter_ocr_results(
+    document: PDFDocument,
+    page_numbers: Optional[list[int]],
+    cache: bool = True,
+) -> Iterator[_PageOCR]:
+    """
+    OCR the selected pages, yielding results in page order.
+    With OCRSettings.WORKERS > 1 and more than one page, pages are fanned out
+    to the shared process pool; otherwise they are rendered from the session
+    in-process.
+    """
+    page_numbers = _select_pages(document.page_count, page_numbers)
+    if ocr_settings.WORKERS <= 1 or len(page_numbers) <= 1:
+        yield from _iter_page_ocr(document, page_numbers, cache=cache)
+        return
+
+    from concurrent.futures.process import BrokenProcessPool
+
+    parent_timings = current_timings()
+    pool = _get_ocr_pool()
+    with _pool_source(document) as (run_key, path):
+        try:
+            results = pool.map(
+                _ocr_page_worker,
+                [run_key] * len(page_numbers),
+                [path] * len(page_numbers),
+                page_numbers,
+            )
+            for page, page_timings in results:
+                if parent_timings is not None:
+                    parent_timings.merge(page_timings)
+                yield page
+        except BrokenProcessPool:
+            shutdown_ocr_pool()  # a worker died; start a fresh pool next time
+            raise
+
+
+def iter_ocr_pages(
+    pdf: Union[Path, PDFDocument],
+    page_numbers: Optional[list[int]] = None,
+) -> Iterator[PageText]:
+    """
+    Streaming counterpart of run_tesseract_on_pdf.
+
+    Yields one cleaned PageText per page, in page order, as soon as it is
+    recognised; rendered pixmaps are released page by page and nothing is
+    cached on the session.
+    """
+    document, owned = as_document(pdf)
+    try:
+        for page in _iter_ocr_results(document, page_numbers, cache=False):
+            yield PageText(
+                page_num=page.page_num,
+                text=clean_text(page.text) if not page.skip_reason else "",
+                engine="tesseract",
+                confidence=round(_average(page.confidences), 2) if not page.skip_reason else None,
+                dpi=page.dpi,
+                skip_reason=page.skip_reason,
+            )
+    finally:
+        if owned:
+            document.close()
+
+
+def run_tesseract_on_pdf(
+    pdf: Union[Path, PDFDocument],
+    page_numbers: Optional[list[int]] = None,
+) -> OCRResult:
+    """
+    Convert each PDF page to an image and run Tesseract on each page.
+    Used when the PDF is scanned (no embedded text).
+
+    Args:
+        pdf:          Path to the PDF, or an open PDFDocument session whose
+                      handle and cached pages are reused.
+        page_numbers: 0-based pages to OCR (default: all). Only these pages
+                      appear in page_texts.
+
+    With OCRSettings.WORKERS > 1 pages are fanned out to a process pool;
+    results are reassembled in page order either way. The DPI each page was
+    finally OCR'd at is reported in page_dpi (see OCRSettings.ADAPTIVE_DPI);
+    blank pages skipped by the ink check have empty page_texts entries and a
+    reason in skipped_pages.
+    """
+    document, owned = as_document(pdf)
+    try:
         page_texts: dict[str, str] = {}
+        page_dpi: dict[str, int] = {}
+        skipped_pages: dict[str, str] = {}
         all_confidences: list[float] = []
         all_text_parts: list[str] = []
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            # Render at 300 DPI for good OCR accuracy
-            mat = fitz.Matrix(300 / 72, 300 / 72)
-            pix = page.get_pixmap(matrix=mat)
-            img_bytes = pix.tobytes("png")
-
-            img = Image.open(io.BytesIO(img_bytes))
-            text = pytesseract.image_to_string(img, lang=ocr_settings.LANGUAGE)
+        for page_num, text, confidences, dpi, skip_reason in _iter_ocr_results(document, page_numbers):
+            page_key = f"page_{page_num + 1}"
+            if skip_reason:
+                page_texts[page_key] = ""
+                skipped_pages[page_key] = skip_reason
+                continue
 
-            data = pytesseract.image_to_data(
-                img, lang=ocr_settings.LANGUAGE, output_type=pytesseract.Output.DICT
-            )
-            confidences = [
-                c for c in data["conf"] if isinstance(c, (int, float)) and c >= 0
-            ]
             if confidences:
                 all_confidences.extend(confidences)
 
             cleaned = clean_text(text)
-            page_key = f"page_{page_num + 1}"
             page_texts[page_key] = cleaned
+            page_dpi[page_key] = dpi
             if cleaned:
                 all_text_parts.append(cleaned)
 
-        doc.close()
-
         raw_text = "\n\n".join(all_text_parts)
-        avg_confidence = (
-            sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
-        )
+        avg_confidence = _average(all_confidences)
 
         return OCRResult(
             success=True,
@@ -132,24 +521,79 @@ def run_tesseract_on_pdf(pdf_path: Path) -> OCRResult:
             word_count=count_words(raw_text),
             confidence=round(avg_confidence, 2),
             engine_used="tesseract",
+            page_dpi=page_dpi,
+            skipped_pages=skipped_pages,
+            pages_skipped=len(skipped_pages),
         )
 
     except Exception as exc:
-        logger.error(f"Tesseract PDF OCR failed for {pdf_path.name}: {exc}")
+        logger.error(f"Tesseract PDF OCR failed for {document.name}: {exc}")
         return OCRResult(success=False, error=str(exc))
+    finally:
+        if owned:
+            document.close()
 
 
 # ─── EasyOCR ─────────────────────────────────────────────────────────────────
+# Process-wide reader pool keyed by language set. Loading a Reader pulls the
+# detection and recognition models from disk, so readers are built lazily,
+# reused across calls and sessions, and evicted least-recently-used once
+# OCRSettings.EASYOCR_POOL_SIZE is exceeded.
+_easyocr_readers: "OrderedDict[tuple[str, ...], Any]" = OrderedDict()
+_easyocr_lock = threading.Lock()
+
+
+def get_easyocr_reader(languages: Optional[list[str]] = None) -> Any:
+    """
+    Return a cached easyocr.Reader for the given languages, creating it on first use.
+    Raises ImportError if easyocr is not installed.
+    """
+    key = tuple(sorted(languages or [ocr_settings.LANGUAGE]))
+
+    with _easyocr_lock:
+        reader = _easyocr_readers.get(key)
+        if reader is not None:
+            _easyocr_readers.move_to_end(key)
+            return reader
+
+        import easyocr
+
+        logger.info(f"Loading EasyOCR reader for languages={list(key)}")
+        reader = easyocr.Reader(list(key), gpu=False)
+        _easyocr_readers[key] = reader
+
+        while len(_easyocr_readers) > max(1, ocr_settings.EASYOCR_POOL_SIZE):
+            evicted, _ = _easyocr_readers.popitem(last=False)
+            logger.info(f"Evicted EasyOCR reader for languages={list(evicted)}")
+
+        return reader
+
+
+def warm_up_easyocr(languages: Optional[list[str]] = None) -> bool:
+    """
+    Preload the EasyOCR reader so the first upload does not pay the model load.
+    Returns True if the reader is ready.
+    """
+    try:
+        get_easyocr_reader(languages)
+        return True
+    except ImportError:
+        logger.warning("easyocr not installed, skipping warm start.")
+    except Exception as exc:
+        logger.error(f"EasyOCR warm start failed: {exc}")
+    return False
+
+
 def run_easyocr(image_path: Path) -> OCRResult:
     """
     Run EasyOCR on a single image file.
     Better than Tesseract for low-quality, noisy, or rotated scans.
     """
     try:
-        import easyocr
-
-        reader = easyocr.Reader([ocr_settings.LANGUAGE], gpu=False)
-        results = reader.readtext(str(image_path))
+        reader = get_easyocr_reader()
+        incr_counter("ocr.easyocr_calls")
+        with record_stage("ocr.easyocr"):
+            results = reader.readtext(str(image_path))
 
         lines: list[str] = []
         confidences: list[float] = []
@@ -180,12 +624,13 @@ def run_easyocr(image_path: Path) -> OCRResult:
 
 
 # ─── Main Entry Point ─────────────────────────────────────────────────────────
-def run_ocr(file_path: Path, file_type: str) -> OCRResult:
+def run_ocr(file_path: Union[Path, PDFDocument], file_type: str) -> OCRResult:
     """
     Route the file to the correct OCR strategy based on file type and config.
 
     Args:
-        file_path: Path to the file (image or PDF).
+        file_path: Path to the file (image or PDF), or an open PDFDocument
+                   session for PDFs.
         file_type: 'image' | 'pdf'
     """
     logger.info(f"Starting OCR on {file_path.name} (type={file_type})")
@@ -197,11 +642,13 @@ def run_ocr(file_path: Path, file_type: str) -> OCRResult:
             result = run_easyocr(file_path)
             if not result.success:
                 logger.warning("EasyOCR failed, falling back to Tesseract.")
+                incr_counter("ocr.fallbacks")
                 result = run_tesseract(file_path)
         else:
             result = run_tesseract(file_path)
             if not result.success:
                 logger.warning("Tesseract failed, falling back to EasyOCR.")
+                incr_counter("ocr.fallbacks")
                 result = run_easyocr(file_path)
 
     elif file_type == "pdf":
@@ -0,0 +1,136 @@
+"""
+PDF Document Session.
+Opens a PDF once and shares the handle across the parsing and OCR paths.
+
+    with PDFDocument.open(path) as document:
+        result = parse_pdf(document)
+        if not is_text_rich(result.raw_text):
+            ocr = run_ocr(document, "pdf")
+
+PyMuPDF and pdfplumber handles are opened lazily on first use (from the file
+or directly from uploaded bytes), and PyMuPDF pages and their text are cached
+so the text path, the hybrid router and the OCR renderer never re-parse the
+xref or reload a page.
+"""
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+@dataclass
+class PageText:
+    """One page of text, as yielded by iter_pdf_pages() / iter_ocr_pages()."""
+    page_num: int                       # 0-based
+    text: str
+    engine: str
+    confidence: Optional[float] = None  # average word confidence (OCR pages)
+    dpi: int = 0                        # render DPI (OCR pages)
+    skip_reason: Optional[str] = None   # set when OCR skipped the page
+
+    @property
+    def page_key(self) -> str:
+        return f"page_{self.page_num + 1}"
+
+
+class PDFDocument:
+    """One PDF, opened at most once per backend."""
+
+    def __init__(self, source: Union[Path, str, bytes], name: Optional[str] = None):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.path: Optional[Path] = None
+            self.data: Optional[bytes] = bytes(source)
+        else:
+            self.path = Path(source)
+            self.data = None
+        self.name = name or (self.path.name if self.path else "document.pdf")
+
+        self._fitz_doc: Any = None
+        self._plumber_pdf: Any = None
+        self._pages: dict[int, Any] = {}
+        self._texts: dict[int, str] = {}
+
+    @classmethod
+    def open(cls, pdf_path: Path) -> "PDFDocument":
+        return cls(pdf_path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "document.pdf") -> "PDFDocument":
+        return cls(data, name=name)
+
+    # ─── Handles ──────────────────────────────────────────────────────────────
+    @property
+    def fitz(self) -> Any:
+        """The PyMuPDF document (opened on first access)."""
+        if self._fitz_doc is None:
+            import fitz  # PyMuPDF
+
+            if self.data is not None:
+                self._fitz_doc = fitz.open(stream=self.data, filetype="pdf")
+            else:
+                self._fitz_doc = fitz.open(str(self.path))
+        return self._fitz_doc
+
+    @property
+    def plumber(self) -> Any:
+        """The pdfplumber document (opened on first access)."""
+        if self._plumber_pdf is None:
+            import pdfplumber
+
+            source = io.BytesIO(self.data) if self.data is not None else str(self.path)
+            self._plumber_pdf = pdfplumber.open(source)
+        return self._plumber_pdf
+
+    # ─── Pages ────────────────────────────────────────────────────────────────
+    @property
+    def page_count(self) -> int:
+        return len(self.fitz)
+
+    def page(self, page_num: int, cache: bool = True) -> Any:
+        """PyMuPDF page (0-based); cache=False for one-pass streaming."""
+        page = self._pages.get(page_num)
+        if page is None:
+            page = self.fitz[page_num]
+            if cache:
+                self._pages[page_num] = page
+        return page
+
+    def page_text(self, page_num: int, cache: bool = True) -> str:
+        """Embedded text of a page, as returned by PyMuPDF."""
+        text = self._texts.get(page_num)
+        if text is None:
+            text = self.page(page_num, cache=cache).get_text("text")
+            if cache:
+                self._texts[page_num] = text
+        return text
+
+    def plumber_page(self, page_num: int) -> Any:
+        return self.plumber.pages[page_num]
+
+    # ─── Lifecycle ────────────────────────────────────────────────────────────
+    def close(self) -> None:
+        self._pages.clear()
+        self._texts.clear()
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._plumber_pdf is not None:
+            self._plumber_pdf.close()
+            self._plumber_pdf = None
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def as_document(pdf: Union[Path, "PDFDocument"]) -> tuple[PDFDocument, bool]:
+    """
+    Normalise a path-or-session argument.
+    Returns (document, owned); owned documents must be closed by the caller.
+    """
+    if isinstance(pdf, PDFDocument):
+        return pdf, False
+    return PDFDocument.open(pdf), True
@@ -6,10 +6,17 @@ with pdfplumber as fallback for table-heavy PDFs.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 
+from app.config.settings import file_settings, ocr_settings
+from app.core.pdf_document import PageText, PDFDocument, as_document
 from app.utils.logger import logger
 from app.utils.text_utils import clean_text, count_words
+from app.utils.timing import incr_counter, record_stage
+
+
+# Bump whenever parsing output changes; part of the extraction cache key.
+PARSER_VERSION = "2"
 
 
 @dataclass
@@ -21,31 +28,29 @@ class PDFExtractionResult:
     page_count: int = 0
     word_count: int = 0
     engine_used: str = ""
+    page_engines: dict[str, str] = field(default_factory=dict)  # page_key -> engine
+    ocr_confidence: float = 0.0     # Average over OCR'd pages (hybrid mode)
     error: Optional[str] = None
 
 
-def extract_with_pymupdf(pdf_path: Path) -> PDFExtractionResult:
+def extract_with_pymupdf(pdf: Union[Path, PDFDocument]) -> PDFExtractionResult:
     """
     Extract text using PyMuPDF (fitz).
     Best for: standard PDFs with embedded text (fast, accurate).
     """
+    document, owned = as_document(pdf)
     try:
-        import fitz  # PyMuPDF
-
-        doc = fitz.open(str(pdf_path))
-        page_texts: dict[str, str] = {}
-        all_text_parts: list[str] = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text("text")
-            cleaned = clean_text(text)
-            page_key = f"page_{page_num + 1}"
-            page_texts[page_key] = cleaned
-            if cleaned:
-                all_text_parts.append(cleaned)
+        with record_stage("pdf.pymupdf"):
+            page_texts: dict[str, str] = {}
+            all_text_parts: list[str] = []
 
-        doc.close()
+            for page_num in range(document.page_count):
+                cleaned = clean_text(document.page_text(page_num))
+                page_key = f"page_{page_num + 1}"
+                page_texts[page_key] = cleaned
+                if cleaned:
+                    all_text_parts.append(cleaned)
+        incr_counter("pdf.pymupdf_pages", len(page_texts))
 
         raw_text = "\n\n".join(all_text_parts)
 
@@ -56,35 +61,47 @@ def extract_with_pymupdf(pdf_path: Path) -> PDFExtractionResult:
             page_count=len(page_texts),
             word_count=count_words(raw_text),
             engine_used="pdfminer",  # PyMuPDF uses a similar label
+            page_engines={key: "pdfminer" for key in page_texts},
         )
 
     except ImportError:
         logger.warning("PyMuPDF (fitz) not installed, falling back to pdfplumber.")
         return PDFExtractionResult(success=False, error="PyMuPDF not available.")
     except Exception as exc:
-        logger.error(f"PyMuPDF extraction failed for {pdf_path.name}: {exc}")
+        logger.error(f"PyMuPDF extraction failed for {document.name}: {exc}")
         return PDFExtractionResult(success=False, error=str(exc))
+    finally:
+        if owned:
+            document.close()
 
 
-def extract_with_pdfplumber(pdf_path: Path) -> PDFExtractionResult:
+def extract_with_pdfplumber(
+    pdf: Union[Path, PDFDocument],
+    page_numbers: Optional[list[int]] = None,
+) -> PDFExtractionResult:
     """
     Extract text using pdfplumber.
     Best for: PDFs with tables (extracts table text in reading order).
+
+    page_numbers limits extraction to those 0-based pages (default: all);
+    only they appear in page_texts.
     """
+    document, owned = as_document(pdf)
     try:
-        import pdfplumber
-
         page_texts: dict[str, str] = {}
         all_text_parts: list[str] = []
 
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                text = page.extract_text() or ""
+        with record_stage("pdf.pdfplumber"):
+            if page_numbers is None:
+                page_numbers = range(len(document.plumber.pages))
+            for page_num in page_numbers:
+                text = document.plumber_page(page_num).extract_text() or ""
                 cleaned = clean_text(text)
                 page_key = f"page_{page_num + 1}"
                 page_texts[page_key] = cleaned
                 if cleaned:
                     all_text_parts.append(cleaned)
+        incr_counter("pdf.pdfplumber_pages", len(page_texts))
 
         raw_text = "\n\n".join(all_text_parts)
 
@@ -95,14 +112,18 @@ def extract_with_pdfplumber(pdf_path: Path) -> PDFExtractionResult:
             page_count=len(page_texts),
             word_count=count_words(raw_text),
             engine_used="pdfplumber",
+            page_engines={key: "pdfplumber" for key in page_texts},
         )
 
     except ImportError:
         logger.warning("pdfplumber not installed.")
         return PDFExtractionResult(success=False, error="pdfplumber not available.")
     except Exception as exc:
-        logger.error(f"pdfplumber extraction failed for {pdf_path.name}: {exc}")
+        logger.error(f"pdfplumber extraction failed for {document.name}: {exc}")
         return PDFExtractionResult(success=False, error=str(exc))
+    finally:
+        if owned:
+            document.close()
 
 
 def is_text_rich(text: str, min_words: int = 30) -> bool:
@@ -113,27 +134,188 @@ def is_text_rich(text: str, min_words: int = 30) -> bool:
     return count_words(text) >= min_words
 
 
-def parse_pdf(pdf_path: Path) -> PDFExtractionResult:
+def _sparse_pages(result: PDFExtractionResult, min_page_words: int) -> list[int]:
+    """0-based numbers of pages with fewer than min_page_words words."""
+    return [
+        page_num
+        for page_num, page_text in enumerate(result.page_texts.values())
+        if not is_text_rich(page_text, min_words=min_page_words)
+    ]
+
+
+def _splice_pages(
+    result: PDFExtractionResult,
+    replacements: dict[str, str],
+    engine: str,
+    **overrides,
+) -> PDFExtractionResult:
+    """
+    Splice re-extracted page texts into result.
+    A page is replaced only when the new text is non-empty and has at least
+    as many words, and page_engines records which engine produced each page.
+    """
+    page_texts = dict(result.page_texts)
+    page_engines = dict(result.page_engines)
+    for page_key, text in replacements.items():
+        if text and count_words(text) >= count_words(page_texts.get(page_key, "")):
+            page_texts[page_key] = text
+            page_engines[page_key] = engine
+
+    raw_text = "\n\n".join(text for text in page_texts.values() if text)
+    engines = set(page_engines.values())
+
+    fields = dict(
+        success=True,
+        raw_text=raw_text,
+        page_texts=page_texts,
+        page_count=len(page_texts),
+        word_count=count_words(raw_text),
+        engine_used=engines.pop() if len(engines) == 1 else "hybrid",
+        page_engines=page_engines,
+        ocr_confidence=result.ocr_confidence,
+    )
+    fields.update(overrides)
+    return PDFExtractionResult(**fields)
+
+
+def parse_pdf_hybrid(
+    pdf: Union[Path, PDFDocument],
+    min_page_words: Optional[int] = None,
+) -> PDFExtractionResult:
+    """
+    Hybrid per-page routing for mixed PDFs (typed tables + scanned pages).
+
+    Each page is classified from its PyMuPDF text density; only pages below
+    min_page_words are rendered and OCR'd. The OCR text is spliced back into
+    page_texts and page_engines records which engine produced each page.
+    """
+    if min_page_words is None:
+        min_page_words = ocr_settings.HYBRID_MIN_PAGE_WORDS
+
+    document, owned = as_document(pdf)
+    try:
+        return _route_sparse_pages(document, min_page_words)
+    finally:
+        if owned:
+            document.close()
+
+
+def _route_sparse_pages(document: PDFDocument, min_page_words: int) -> PDFExtractionResult:
+    from app.core.ocr_engine import run_tesseract_on_pdf
+
+    result = extract_with_pymupdf(document)
+    if not result.success:
+        return result
+
+    sparse_pages = _sparse_pages(result, min_page_words)
+    if not sparse_pages:
+        return result
+
+    logger.info(
+        f"Hybrid PDF routing: OCR on {len(sparse_pages)}/{result.page_count} "
+        f"sparse pages of {document.name}"
+    )
+    incr_counter("pdf.hybrid_ocr_pages", len(sparse_pages))
+    ocr = run_tesseract_on_pdf(document, page_numbers=sparse_pages)
+    if not ocr.success:
+        logger.warning(f"Hybrid OCR failed for {document.name}: {ocr.error}")
+        return result
+
+    # Embedded text is kept where OCR recovered less than it
+    return _splice_pages(result, ocr.page_texts, ocr.engine_used, ocr_confidence=ocr.confidence)
+
+
+def iter_pdf_pages(
+    pdf: Union[Path, PDFDocument],
+    fallback: bool = True,
+) -> Iterator[PageText]:
+    """
+    Streaming counterpart of parse_pdf's text path.
+
+    Yields one cleaned PageText per page as soon as it is extracted. Pages
+    with fewer than FileSettings.PDF_FALLBACK_MIN_PAGE_WORDS words are
+    re-extracted with pdfplumber when fallback is set. Nothing is cached on
+    the session, so memory stays bounded by a single page.
+    """
+    document, owned = as_document(pdf)
+    try:
+        for page_num in range(document.page_count):
+            with record_stage("pdf.pymupdf"):
+                text = clean_text(document.page_text(page_num, cache=False))
+            incr_counter("pdf.pymupdf_pages")
+            engine = "pdfminer"
+
+            if fallback and not is_text_rich(text, min_words=file_settings.PDF_FALLBACK_MIN_PAGE_WORDS):
+                incr_counter("pdf.fallback_pages")
+                with record_stage("pdf.pdfplumber"):
+                    plumber_page = document.plumber_page(page_num)
+                    try:
+                        alt_text = clean_text(plumber_page.extract_text() or "")
+                    finally:
+                        plumber_page.close()  # drop pdfplumber's layout cache
+                incr_counter("pdf.pdfplumber_pages")
+                if alt_text and count_words(alt_text) >= count_words(text):
+                    text, engine = alt_text, "pdfplumber"
+
+            yield PageText(page_num=page_num, text=text, engine=engine)
+    finally:
+        if owned:
+            document.close()
+
+
+def parse_pdf(pdf: Union[Path, PDFDocument], hybrid: Optional[bool] = None) -> PDFExtractionResult:
     """
     Main entry point for PDF parsing.
     Strategy:
         1. Try PyMuPDF (fastest, best for text PDFs)
-        2. Try pdfplumber (better for tables)
-        3. Return best result; if text is sparse, caller should run OCR
+        2. Re-extract only pages with fewer than
+           FileSettings.PDF_FALLBACK_MIN_PAGE_WORDS words with pdfplumber
+           (better for tables) and splice them in; the whole document goes
+           through pdfplumber only if PyMuPDF fails outright
+        3. Return the result; if text is sparse, caller should run OCR
+
+    With hybrid=True (default: OCRSettings.HYBRID_PDF) sparse pages are
+    OCR'd here instead, see parse_pdf_hybrid().
+
+    Pass an open PDFDocument to share one handle with a later run_ocr call;
+    a path is opened (and closed) here.
     """
-    if not pdf_path.exists():
-        return PDFExtractionResult(success=False, error=f"File not found: {pdf_path}")
+    if isinstance(pdf, Path) and not pdf.exists():
+        return PDFExtractionResult(success=False, error=f"File not found: {pdf}")
+
+    document, owned = as_document(pdf)
+    try:
+        return _parse_document(document, hybrid)
+    finally:
+        if owned:
+            document.close()
 
-    logger.info(f"Parsing PDF: {pdf_path.name}")
 
-    # Try PyMuPDF first
-    result = extract_with_pymupdf(pdf_path)
+def _parse_document(document: PDFDocument, hybrid: Optional[bool]) -> PDFExtractionResult:
+    logger.info(f"Parsing PDF: {document.name}")
 
-    if not result.success or not is_text_rich(result.raw_text):
-        logger.info(f"PyMuPDF gave sparse results for {pdf_path.name}, trying pdfplumber.")
-        fallback = extract_with_pdfplumber(pdf_path)
-        if fallback.success and is_text_rich(fallback.raw_text):
-            result = fallback
+    if hybrid is None:
+        hybrid = ocr_settings.HYBRID_PDF
+
+    # Try PyMuPDF first (OCR'ing sparse pages in hybrid mode)
+    result = parse_pdf_hybrid(document) if hybrid else extract_with_pymupdf(document)
+
+    if not result.success:
+        logger.info(f"PyMuPDF failed for {document.name}, trying pdfplumber.")
+        incr_counter("pdf.fallbacks")
+        result = extract_with_pdfplumber(document)
+    else:
+        sparse_pages = _sparse_pages(result, file_settings.PDF_FALLBACK_MIN_PAGE_WORDS)
+        if sparse_pages:
+            logger.info(
+                f"pdfplumber fallback on {len(sparse_pages)}/{result.page_count} "
+                f"sparse pages of {document.name}"
+            )
+            incr_counter("pdf.fallbacks")
+            incr_counter("pdf.fallback_pages", len(sparse_pages))
+            fallback = extract_with_pdfplumber(document, page_numbers=sparse_pages)
+            if fallback.success:
+                result = _splice_pages(result, fallback.page_texts, fallback.engine_used)
 
     if result.success:
         logger.info(
@@ -141,6 +323,6 @@ def parse_pdf(pdf_path: Path) -> PDFExtractionResult:
             f"{result.word_count} words via {result.engine_used}"
         )
     else:
-        logger.warning(f"PDF parsing failed for {pdf_path.name}: {result.error}")
+        logger.warning(f"PDF parsing failed for {document.name}: {result.error}")
 
-    return result
\ No newline at end of file
+    return result
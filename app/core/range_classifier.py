@@ -0,0 +1,213 @@
+"""
+Vectorized Reference-Range Classifier.
+Classifies arrays of (metric_key, value) against REFERENCE_RANGES in bulk.
+
+    codes = classify_values(keys, values, sex=sexes, age=ages)
+    names = status_names(codes)          # "normal" | "low" | ...
+
+Same rules as data_extractor._compute_status, evaluated with NumPy over whole
+arrays (cohort analytics over millions of health_metrics rows). Ranges can be
+refined per sex and age band with RangeRule entries; the table is resolved
+once into dense (metric, sex, age band) arrays, so classification is a
+gather plus a few vector comparisons, with no Python loop per value.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.data_extractor import (
+    CRITICAL_HIGH_FACTOR,
+    CRITICAL_LOW_FACTOR,
+    REFERENCE_RANGES,
+)
+
+
+# ─── Status Codes ─────────────────────────────────────────────────────────────
+STATUS_UNKNOWN, STATUS_NORMAL, STATUS_LOW, STATUS_HIGH, STATUS_CRITICAL = range(5)
+STATUS_NAMES: tuple[str, ...] = ("unknown", "normal", "low", "high", "critical")
+
+SEXES: tuple[str, ...] = ("any", "male", "female")
+_SEX_ALIASES = {"male": 1, "m": 1, "female": 2, "f": 2}
+
+
+@dataclass(frozen=True)
+class RangeRule:
+    """Reference range override for one metric, optionally per sex / age band."""
+    metric_key: str
+    ref_min: float
+    ref_max: float
+    sex: Optional[str] = None           # "male" | "female" | None (both)
+    age_min: Optional[float] = None     # inclusive
+    age_max: Optional[float] = None     # exclusive
+
+
+@dataclass
+class RangeTable:
+    """Dense reference ranges indexed by [metric, sex, age band]."""
+    metric_keys: list[str]
+    age_edges: np.ndarray               # sorted band boundaries
+    mins: np.ndarray                    # float64[n_metrics, 3, n_bands]
+    maxs: np.ndarray
+
+    def __post_init__(self) -> None:
+        # Flattened copies with a trailing all-NaN metric row, so row -1
+        # (metric without a range) gathers NaN bounds
+        pad = np.full((1, *self.mins.shape[1:]), np.nan)
+        self.flat_mins = np.concatenate([self.mins, pad]).ravel()
+        self.flat_maxs = np.concatenate([self.maxs, pad]).ravel()
+
+    @property
+    def unknown_age_band(self) -> int:
+        """Last band: used for missing ages, only age-unbounded rules apply."""
+        return len(self.age_edges) + 1
+
+    def metric_index(self, metric_keys) -> np.ndarray:
+        """
+        Map metric keys to table rows (-1 for keys without a range).
+        The result can be passed back to classify_values() in place of the
+        keys to classify the same rows again without re-encoding.
+        """
+        return _encode(metric_keys, {key: i for i, key in enumerate(self.metric_keys)}, -1)
+
+
+def _encode(labels, mapping: dict[str, int], default: int) -> np.ndarray:
+    """
+    Map a label array to integer codes. Categoricals reuse their codes;
+    anything else is hashed once with pd.factorize. Either way only the
+    distinct labels go through the Python mapping.
+    """
+    if isinstance(labels, pd.Series) and isinstance(labels.dtype, pd.CategoricalDtype):
+        labels = labels.array
+    if isinstance(labels, pd.Categorical):
+        codes, uniques = labels.codes, labels.categories
+    else:
+        labels = np.asarray(labels) if np.ndim(labels) else np.array([labels], dtype=object)
+        codes, uniques = pd.factorize(labels.ravel())
+    lookup = np.array(
+        [mapping.get(str(label).strip().lower(), default) for label in uniques] + [default],
+        dtype=np.intp,
+    )
+    return lookup[codes]  # code -1 (missing label) picks the trailing default
+
+
+def _covers(rule: RangeRule, sex: int, lower: float, upper: float, unknown_age: bool) -> bool:
+    if rule.sex is not None and _SEX_ALIASES.get(rule.sex.lower()) != sex:
+        return False
+    if unknown_age:
+        return rule.age_min is None and rule.age_max is None
+    age_min = -np.inf if rule.age_min is None else rule.age_min
+    age_max = np.inf if rule.age_max is None else rule.age_max
+    return age_min <= lower and upper <= age_max
+
+
+def build_range_table(rules: Sequence[RangeRule] = ()) -> RangeTable:
+    """
+    Resolve REFERENCE_RANGES plus rules into a RangeTable.
+    More specific rules win: sex-specific over both-sex, age-banded over
+    unbounded; among equals the later rule wins.
+    """
+    metric_keys = list(REFERENCE_RANGES)
+    metric_keys += sorted({r.metric_key for r in rules} - set(metric_keys))
+    row = {key: i for i, key in enumerate(metric_keys)}
+
+    edges = sorted({
+        float(age) for r in rules for age in (r.age_min, r.age_max) if age is not None
+    })
+    age_edges = np.array(edges, dtype=np.float64)
+    n_bands = len(edges) + 2            # bands between edges, plus unknown age
+
+    mins = np.full((len(metric_keys), len(SEXES), n_bands), np.nan)
+    maxs = np.full_like(mins, np.nan)
+    for key, (ref_min, ref_max, _unit) in REFERENCE_RANGES.items():
+        mins[row[key]] = ref_min
+        maxs[row[key]] = ref_max
+
+    ordered = sorted(
+        rules,
+        key=lambda r: (r.sex is not None, r.age_min is not None or r.age_max is not None),
+    )
+    bounds = [-np.inf, *edges, np.inf]
+    for band in range(n_bands):
+        unknown_age = band == n_bands - 1
+        lower, upper = (0.0, 0.0) if unknown_age else (bounds[band], bounds[band + 1])
+        for sex in range(len(SEXES)):
+            for rule in ordered:
+                if _covers(rule, sex, lower, upper, unknown_age):
+                    mins[row[rule.metric_key], sex, band] = rule.ref_min
+                    maxs[row[rule.metric_key], sex, band] = rule.ref_max
+
+    return RangeTable(metric_keys=metric_keys, age_edges=age_edges, mins=mins, maxs=maxs)
+
+
+DEFAULT_RANGE_TABLE = build_range_table()
+
+
+# ─── Classification ───────────────────────────────────────────────────────────
+def _sex_index(sex: Union[str, Sequence, np.ndarray, None], size: int) -> np.ndarray:
+    if sex is None:
+        return np.zeros(size, dtype=np.intp)
+    return np.broadcast_to(_encode(sex, _SEX_ALIASES, 0), (size,))
+
+
+def _age_band(
+    age: Union[float, Sequence, np.ndarray, None], size: int, table: RangeTable
+) -> np.ndarray:
+    if age is None:
+        return np.full(size, table.unknown_age_band, dtype=np.intp)
+    ages = np.broadcast_to(np.asarray(age, dtype=np.float64), (size,))
+    bands = np.searchsorted(table.age_edges, ages, side="right")
+    return np.where(np.isnan(ages), table.unknown_age_band, bands)
+
+
+def classify_values(
+    metric_keys: Union[Sequence[str], np.ndarray],
+    values: Union[Sequence[float], np.ndarray],
+    sex: Union[str, Sequence, np.ndarray, None] = None,
+    age: Union[float, Sequence, np.ndarray, None] = None,
+    table: RangeTable = DEFAULT_RANGE_TABLE,
+) -> np.ndarray:
+    """
+    Classify values in bulk; returns int8 status codes (see STATUS_NAMES).
+
+    metric_keys may be strings, a pandas Categorical (codes are reused) or
+    the integer rows from table.metric_index(). sex / age may be scalars or
+    per-value arrays; missing or unrecognised entries fall back to the
+    both-sex / age-unbounded ranges. Metrics without a range and non-finite
+    values are STATUS_UNKNOWN.
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    if vals.ndim != 1 or len(metric_keys) != len(vals):
+        raise ValueError("metric_keys and values must be 1-D arrays of equal length")
+
+    size = len(vals)
+    codes = np.full(size, STATUS_UNKNOWN, dtype=np.int8)
+    if not size:
+        return codes
+
+    if isinstance(metric_keys, np.ndarray) and metric_keys.dtype.kind in "iu":
+        rows = metric_keys.astype(np.intp, copy=False)
+    else:
+        rows = table.metric_index(metric_keys)
+    sexes = _sex_index(sex, size)
+    bands = _age_band(age, size, table)
+
+    # One flat gather per bound; unknown metrics (row -1) hit the NaN padding row
+    flat = (rows * len(SEXES) + sexes) * table.mins.shape[2] + bands
+    ref_min = table.flat_mins.take(flat)
+    ref_max = table.flat_maxs.take(flat)
+
+    # NaN compares False, so NaN values/ranges fall through every branch
+    codes[vals <= ref_max] = STATUS_NORMAL      # covers lo <= v <= hi and v < lo
+    codes[vals > ref_max] = STATUS_HIGH
+    codes[vals < ref_min] = STATUS_LOW
+    codes[(vals < ref_min * CRITICAL_LOW_FACTOR) | (vals > ref_max * CRITICAL_HIGH_FACTOR)] = STATUS_CRITICAL
+    codes[np.isnan(ref_min) | ~np.isfinite(vals)] = STATUS_UNKNOWN
+    return codes
+
+
+def status_names(codes: np.ndarray) -> np.ndarray:
+    """Map status codes to their names ("normal", "low", ...)."""
+    return np.asarray(STATUS_NAMES, dtype=object)[np.asarray(codes, dtype=np.intp)]
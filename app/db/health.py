@@ -0,0 +1,153 @@
+"""
+Database Health Monitor.
+Process-wide, TTL-cached view of database reachability.
+
+The sidebar and every page guard read the cached state instead of opening a
+connection on each Streamlit rerun. A daemon thread refreshes the state every
+HEALTH_TTL_SECONDS, and a circuit breaker backs off probing while the
+database is down:
+
+    closed    → healthy; probed every TTL
+    open      → HEALTH_FAILURE_THRESHOLD consecutive failures; no probes
+                until HEALTH_OPEN_SECONDS have passed
+    half_open → one trial probe; success closes the circuit, failure reopens it
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config.settings import db_settings
+from app.db.connection import check_connection
+from app.utils.logger import logger
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class HealthSnapshot:
+    """Point-in-time database health state."""
+    healthy: bool
+    circuit: str
+    checked_at: float           # time.monotonic() of the last probe
+    consecutive_failures: int
+
+
+class DatabaseHealthMonitor:
+    """Cached health check with a background refresher and circuit breaker."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        failure_threshold: int,
+        open_seconds: float,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_seconds = open_seconds
+
+        self._lock = threading.Lock()
+        self._refresher_lock = threading.Lock()
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._opened_at = 0.0
+        self._refresher: Optional[threading.Thread] = None
+
+    def _probe_due(self, now: float) -> bool:
+        snap = self._snapshot
+        if snap is None:
+            return True
+        if snap.circuit == OPEN:
+            return now - self._opened_at >= self.open_seconds
+        return now - snap.checked_at >= self.ttl_seconds
+
+    def refresh(self, force: bool = False) -> HealthSnapshot:
+        """Probe the database if the cached state is stale (or force=True)."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and not self._probe_due(now):
+                return self._snapshot
+
+            previous = self._snapshot
+            failures = previous.consecutive_failures if previous else 0
+            circuit = previous.circuit if previous else CLOSED
+            if circuit == OPEN:
+                circuit = HALF_OPEN
+
+            try:
+                healthy = bool(check_connection())
+            except Exception as exc:
+                logger.debug(f"Database health probe raised: {exc}")
+                healthy = False
+
+            if healthy:
+                failures = 0
+                if circuit != CLOSED:
+                    logger.info("Database reachable again, closing circuit.")
+                circuit = CLOSED
+            else:
+                failures += 1
+                if circuit == HALF_OPEN or failures >= self.failure_threshold:
+                    if circuit != OPEN:
+                        logger.warning(
+                            f"Database unreachable ({failures} failed probes), "
+                            f"opening circuit for {self.open_seconds:.0f}s."
+                        )
+                    circuit = OPEN
+                    self._opened_at = now
+
+            self._snapshot = HealthSnapshot(
+                healthy=healthy,
+                circuit=circuit,
+                checked_at=now,
+                consecutive_failures=failures,
+            )
+            return self._snapshot
+
+    def snapshot(self) -> HealthSnapshot:
+        """
+        Cached state. Only the very first call probes synchronously; after that
+        the background refresher keeps the snapshot current.
+        """
+        self.start_refresher()
+        snap = self._snapshot
+        return snap if snap is not None else self.refresh()
+
+    def is_healthy(self) -> bool:
+        return self.snapshot().healthy
+
+    def start_refresher(self) -> None:
+        """Start the background refresher thread (idempotent)."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        with self._refresher_lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="db-health", daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.debug(f"Database health refresher error: {exc}")
+            time.sleep(max(1.0, min(self.ttl_seconds, self.open_seconds) / 2))
+
+
+# ─── Singleton Instance ───────────────────────────────────────────────────────
+db_health = DatabaseHealthMonitor(
+    ttl_seconds=db_settings.HEALTH_TTL_SECONDS,
+    failure_threshold=db_settings.HEALTH_FAILURE_THRESHOLD,
+    open_seconds=db_settings.HEALTH_OPEN_SECONDS,
+)
+
+
+def is_db_available() -> bool:
+    """Cached database reachability for sidebar and page guards."""
+    return db_health.is_healthy()
@@ -0,0 +1,10 @@
+-- 002_report_query_indexes.sql
+-- Indexes backing the report-service query API (dashboard selector, report listings).
+
+-- Completed reports, newest first (Dashboard "Active Report" selector)
+CREATE INDEX IF NOT EXISTS idx_medical_reports_status_created
+    ON medical_reports (status, created_at DESC);
+
+-- Join from reports to their patient
+CREATE INDEX IF NOT EXISTS idx_medical_reports_patient_id
+    ON medical_reports (patient_id);
@@ -0,0 +1,12 @@
+-- 003_report_pagination_indexes.sql
+-- Keyset pagination on the View Reports page: (created_at, id) descending,
+-- optionally filtered by patient or status.
+
+CREATE INDEX IF NOT EXISTS idx_medical_reports_created_id
+    ON medical_reports (created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_medical_reports_patient_created_id
+    ON medical_reports (patient_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_medical_reports_status_created_id
+    ON medical_reports (status, created_at DESC, id DESC);
@@ -0,0 +1,7 @@
+-- 004_report_stage_timings.sql
+-- Per-stage processing breakdown stored with each report:
+--   {"timings_ms": {"pdf.pymupdf": 41.2, "ocr.tesseract": 5230.0, ...},
+--    "counters":   {"ocr.pages_rendered": 3, "pdf.fallbacks": 1, ...}}
+
+ALTER TABLE medical_reports
+    ADD COLUMN IF NOT EXISTS stage_timings JSONB;
@@ -0,0 +1,9 @@
+-- 005_report_extractor_version.sql
+-- Version of app.core.data_extractor that produced a report's metrics/notes.
+-- python -m app.services.reextract re-processes reports behind EXTRACTOR_VERSION.
+
+ALTER TABLE medical_reports
+    ADD COLUMN IF NOT EXISTS extractor_version VARCHAR(20);
+
+CREATE INDEX IF NOT EXISTS idx_medical_reports_extractor_version
+    ON medical_reports (extractor_version);
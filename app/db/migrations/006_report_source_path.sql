@@ -0,0 +1,11 @@
+-- 006_report_source_path.sql
+-- Source file of a report loaded by python -m app.services.bulk_ingest.
+-- Written in the same transaction as the report, so a resumed run skips files
+-- that were committed but not yet journaled instead of inserting them twice.
+
+ALTER TABLE medical_reports
+    ADD COLUMN IF NOT EXISTS source_path TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_medical_reports_source_path
+    ON medical_reports (source_path)
+    WHERE source_path IS NOT NULL;
@@ -0,0 +1,395 @@
+"""
+Bulk Ingestion CLI.
+Back-loads a directory of historical reports into the database.
+
+    python -m app.services.bulk_ingest <reports_dir> --manifest manifest.csv
+
+The manifest is a CSV with `path,patient_id` columns (path relative to the
+reports directory). Files are parsed/OCR'd/extracted across a process pool
+(a bounded window of files in flight) and persisted in batched transactions.
+Each report row records its source path, and each committed batch is
+appended to a journal file, so an interrupted run resumes where it stopped
+without inserting any file twice. Files that failed stay journaled (and
+stored as failed reports) until a run with --retry-failed processes them
+again.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Optional, Union
+from uuid import UUID
+
+from app.config.settings import file_settings
+from app.core.data_extractor import EXTRACTOR_VERSION, ExtractionResult, extract_data_from_text
+from app.core.ocr_engine import OCRResult, run_ocr
+from app.core.pdf_document import PDFDocument
+from app.core.pdf_parser import PDFExtractionResult, is_text_rich, parse_pdf
+from app.utils.logger import logger
+from app.utils.text_utils import count_words
+from app.utils.timing import timing_scope
+
+
+JOURNAL_NAME = ".bulk_ingest_journal.jsonl"
+
+FILE_TYPES = {
+    "pdf": "pdf",
+    "txt": "text",
+    **{ext: "image" for ext in ("png", "jpg", "jpeg", "tiff", "bmp")},
+}
+
+
+@dataclass
+class ProcessedFile:
+    """Pipeline output for one file; picklable so it can cross the process pool."""
+    rel_path: str
+    file_type: str
+    file_size_bytes: int
+    raw_text: str = ""
+    page_texts: dict[str, str] = field(default_factory=dict)
+    page_count: int = 0
+    word_count: int = 0
+    engine_used: str = ""
+    ocr_confidence: Optional[float] = None
+    extraction: ExtractionResult = field(default_factory=ExtractionResult)
+    duration_ms: int = 0
+    stage_timings: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+# ─── Worker ───────────────────────────────────────────────────────────────────
+def process_file(root: str, rel_path: str) -> ProcessedFile:
+    """Run parse_pdf / run_ocr + extract_data_from_text on one file."""
+    start = time.perf_counter()
+    path = Path(root) / rel_path
+    file_type = FILE_TYPES.get(path.suffix.lower().lstrip("."), "image")
+    item = ProcessedFile(rel_path=rel_path, file_type=file_type, file_size_bytes=0)
+    try:
+        item.file_size_bytes = path.stat().st_size
+    except OSError as exc:  # vanished since discovery: a failed file, not a failed run
+        item.error = str(exc)
+        return item
+
+    with timing_scope() as timings:
+        _run_pipeline(path, item)
+
+    item.stage_timings = timings.to_dict()
+    item.duration_ms = int((time.perf_counter() - start) * 1000)
+    return item
+
+
+def _parse_or_ocr(path: Path, file_type: str) -> Union[PDFExtractionResult, OCRResult]:
+    """Text layer first for PDFs, OCR when it is missing or sparse."""
+    if file_type != "pdf":
+        return run_ocr(path, file_type)
+
+    # One document session for the text path and any OCR pass
+    with PDFDocument.open(path) as document:
+        result = parse_pdf(document)
+        if not result.success or not is_text_rich(result.raw_text):
+            ocr = run_ocr(document, file_type)
+            if ocr.success:
+                result = ocr
+    return result
+
+
+def _run_pipeline(path: Path, item: ProcessedFile) -> None:
+    """Fill item with parsed text and extraction results (errors go to item.error)."""
+    file_type = item.file_type
+    try:
+        if file_type == "text":
+            item.raw_text = path.read_text(encoding="utf-8", errors="ignore")
+            item.page_texts = {"page_1": item.raw_text}
+            item.page_count = 1
+            item.engine_used = "text"
+        else:
+            result = _parse_or_ocr(path, file_type)
+            if not result.success:
+                raise RuntimeError(result.error or "OCR failed")
+            if isinstance(result, OCRResult):
+                item.ocr_confidence = result.confidence
+
+            item.raw_text = result.raw_text
+            item.page_texts = result.page_texts
+            item.page_count = result.page_count
+            item.engine_used = result.engine_used
+
+        item.word_count = count_words(item.raw_text)
+        # Same full-text extraction as uploads and the re-extraction job
+        item.extraction = extract_data_from_text(item.raw_text)
+    except Exception as exc:
+        item.error = str(exc)
+
+
+# ─── Persistence ──────────────────────────────────────────────────────────────
+def persist_batch(root: Path, items: list[tuple[UUID, ProcessedFile]]) -> int:
+    """
+    Write a batch of processed files in a single transaction.
+    Report and extracted-text rows go through the ORM, one flush per table
+    (the report IDs are needed); metrics and notes for the whole batch use
+    the bulk insert/COPY path.
+
+    Files whose source path is already stored (committed by a run that died
+    before journaling) are skipped, unless the stored report failed: that
+    row is replaced, so retried files never leave a duplicate. Returns the
+    number of reports written.
+    """
+    from sqlalchemy import delete, select
+
+    from app.db.connection import get_session
+    from app.db.models import ExtractedData, MedicalReport, ReportStatus
+    from app.services.bulk_persistence import bulk_save_extractions, enum_for
+
+    sources = {item.rel_path: source_path(root, item.rel_path) for _, item in items}
+
+    with get_session() as session:
+        stored = session.execute(
+            select(MedicalReport.source_path, MedicalReport.status)
+            .where(MedicalReport.source_path.in_(list(sources.values())))
+        ).all()
+        existing = {path for path, status in stored if status != ReportStatus.FAILED}
+        failed = [path for path, status in stored if status == ReportStatus.FAILED]
+        if existing:
+            logger.info(f"{len(existing)} files already ingested by an earlier run; skipping.")
+        if failed:
+            # Failed reports carry no extracted data, so the row is all there is
+            session.execute(
+                delete(MedicalReport).where(MedicalReport.source_path.in_(failed))
+            )
+
+        reports: list[tuple[MedicalReport, ProcessedFile]] = []
+        for patient_id, item in items:
+            if sources[item.rel_path] in existing:
+                continue
+            report = MedicalReport(
+                patient_id=patient_id,
+                original_filename=Path(item.rel_path).name,
+                source_path=sources[item.rel_path],
+                file_type=enum_for(MedicalReport.file_type, item.file_type),
+                file_size_bytes=item.file_size_bytes,
+                status=ReportStatus.FAILED if item.error else ReportStatus.COMPLETED,
+                error_message=item.error,
+                page_count=item.page_count,
+                processing_duration_ms=item.duration_ms,
+                stage_timings=item.stage_timings,
+                extractor_version=None if item.error else EXTRACTOR_VERSION,
+            )
+            session.add(report)
+            reports.append((report, item))
+
+        # One flush for the whole batch; the multi-row INSERT assigns every report.id
+        session.flush()
+
+        extractions: list[tuple[UUID, ExtractionResult]] = []
+        for report, item in reports:
+            if item.error:
+                continue
+            session.add(ExtractedData(
+                report_id=report.id,
+                raw_text=item.raw_text,
+                page_texts=item.page_texts,
+                word_count=item.word_count,
+                ocr_engine=enum_for(ExtractedData.ocr_engine, item.engine_used),
+                ocr_confidence=item.ocr_confidence,
+            ))
+            extractions.append((report.id, item.extraction))
+
+        session.flush()
+        bulk_save_extractions(session, extractions)
+        session.commit()
+    return len(reports)
+
+
+# ─── Discovery / Manifest / Journal ───────────────────────────────────────────
+def source_path(root: Path, rel_path: str) -> str:
+    """Absolute path stored on the report row; the idempotency key for resumes."""
+    return str((root / rel_path).resolve())
+
+
+def discover_files(root: Path) -> list[str]:
+    """All supported report files under root, as sorted relative paths."""
+    allowed = set(FILE_TYPES) & (file_settings.ALLOWED_EXTENSIONS | {"txt"})
+    return sorted(
+        str(path.relative_to(root))
+        for path in root.rglob("*")
+        if path.is_file()
+        and path.suffix.lower().lstrip(".") in allowed
+        and not path.name.startswith(".")
+    )
+
+
+def load_manifest(manifest_path: Path) -> dict[str, UUID]:
+    """Read `path,patient_id` rows into a rel_path → patient UUID map."""
+    mapping: dict[str, UUID] = {}
+    with manifest_path.open(newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            try:
+                mapping[os.path.normpath(row["path"].strip())] = UUID(row["patient_id"].strip())
+            except (KeyError, ValueError) as exc:
+                logger.warning(f"Skipping manifest row {row}: {exc}")
+    return mapping
+
+
+def load_journal(journal_path: Path, retry_failed: bool = False) -> set[str]:
+    """
+    Relative paths already committed by a previous run. With retry_failed,
+    files whose last journaled attempt failed are left out, so they run again.
+    """
+    if not journal_path.exists():
+        return set()
+    done: set[str] = set()
+    with journal_path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+                path = entry["path"]
+            except (json.JSONDecodeError, KeyError):
+                continue  # torn last line after a crash
+            if retry_failed and entry.get("error"):
+                done.discard(path)
+            else:
+                done.add(path)
+    return done
+
+
+def _append_journal(journal_path: Path, items: list[tuple[UUID, ProcessedFile]]) -> None:
+    with journal_path.open("a", encoding="utf-8") as fh:
+        for _, item in items:
+            fh.write(json.dumps({"path": item.rel_path, "error": item.error}) + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def _render_progress(done: int, total: int, failed: int, started: float) -> None:
+    width = 30
+    filled = int(width * done / total) if total else width
+    rate = done / max(time.perf_counter() - started, 1e-6)
+    sys.stderr.write(
+        f"\r[{'#' * filled}{'.' * (width - filled)}] {done}/{total} "
+        f"· {failed} failed · {rate:.1f} files/s"
+    )
+    sys.stderr.flush()
+
+
+# ─── Main Entry Point ─────────────────────────────────────────────────────────
+def run_bulk_ingest(
+    root: Path,
+    manifest: dict[str, UUID],
+    workers: int,
+    batch_size: int,
+    journal_path: Optional[Path] = None,
+    retry_failed: bool = False,
+) -> dict[str, int]:
+    """
+    Ingest every mapped, not-yet-journaled file under root (with
+    retry_failed, also files whose last attempt failed).
+    Returns counters: total, skipped, processed, failed.
+    """
+    journal_path = journal_path or root / JOURNAL_NAME
+    already_done = load_journal(journal_path, retry_failed)
+
+    pending: list[tuple[str, UUID]] = []
+    unmapped = 0
+    for rel_path in discover_files(root):
+        if rel_path in already_done:
+            continue
+        patient_id = manifest.get(os.path.normpath(rel_path))
+        if patient_id is None:
+            unmapped += 1
+            continue
+        pending.append((rel_path, patient_id))
+
+    if unmapped:
+        logger.warning(f"{unmapped} files have no patient in the manifest and were skipped.")
+    logger.info(
+        f"Bulk ingest: {len(pending)} files to process, "
+        f"{len(already_done)} already done, {workers} workers"
+    )
+
+    stats = {"total": len(pending), "skipped": len(already_done) + unmapped,
+             "processed": 0, "failed": 0}
+    batch: list[tuple[UUID, ProcessedFile]] = []
+    started = time.perf_counter()
+
+    def _flush() -> None:
+        if batch:
+            persist_batch(root, batch)
+            _append_journal(journal_path, batch)
+            batch.clear()
+
+    # Only a bounded window of files is queued on the pool, so an error
+    # cancels at most that many instead of waiting for the whole archive.
+    window = max(1, workers) * 2
+    queue = iter(pending)
+    in_flight: dict[Future, UUID] = {}
+    pool = ProcessPoolExecutor(max_workers=max(1, workers))
+    try:
+        while True:
+            for rel_path, patient_id in islice(queue, window - len(in_flight)):
+                in_flight[pool.submit(process_file, str(root), rel_path)] = patient_id
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                patient_id = in_flight.pop(future)
+                item = future.result()
+                if item.error:
+                    stats["failed"] += 1
+                    logger.warning(f"{item.rel_path}: {item.error}")
+                stats["processed"] += 1
+                batch.append((patient_id, item))
+                if len(batch) >= batch_size:
+                    _flush()
+                _render_progress(stats["processed"], stats["total"], stats["failed"], started)
+        _flush()
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    sys.stderr.write("\n")
+    logger.info(f"Bulk ingest finished: {stats}")
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.bulk_ingest",
+        description="Bulk-ingest a directory of medical reports.",
+    )
+    parser.add_argument("directory", type=Path, help="Root directory of report files")
+    parser.add_argument("--manifest", type=Path, required=True,
+                        help="CSV with path,patient_id columns")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Reports per database transaction")
+    parser.add_argument("--journal", type=Path, default=None,
+                        help=f"Resume journal (default: <directory>/{JOURNAL_NAME})")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Process files that failed in earlier runs again")
+    args = parser.parse_args(argv)
+
+    if not args.directory.is_dir():
+        parser.error(f"Not a directory: {args.directory}")
+
+    stats = run_bulk_ingest(
+        root=args.directory,
+        manifest=load_manifest(args.manifest),
+        workers=args.workers,
+        batch_size=max(1, args.batch_size),
+        journal_path=args.journal,
+        retry_failed=args.retry_failed,
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
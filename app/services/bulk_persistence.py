@@ -0,0 +1,168 @@
+"""
+Bulk Persistence Service.
+Batched writes of ExtractionResult metrics and notes.
+
+Instead of one ORM add per ExtractedMetric / ExtractedNote, rows for many
+reports are collected and written per table in chunks of
+DatabaseSettings.BULK_BATCH_SIZE, either as multi-row INSERTs or (PostgreSQL,
+DB_BULK_METHOD=copy) through COPY FROM STDIN. The caller owns the session and
+transaction, so many reports land in one commit.
+"""
+
+import io
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from app.config.settings import db_settings
+from app.core.data_extractor import ExtractionResult
+from app.db.models import HealthMetric, TextualNote
+from app.utils.logger import logger
+
+
+def enum_for(column, value: Optional[str]):
+    """Coerce a string to the Enum class backing an ORM column (None if unknown)."""
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is None or value is None:
+        return value
+    try:
+        return enum_class(value)
+    except ValueError:
+        return None
+
+
+def _metric_rows(report_id: UUID, result: ExtractionResult) -> list[dict[str, Any]]:
+    return [
+        {
+            "report_id": report_id,
+            "metric_name": m.metric_name,
+            "metric_key": m.metric_key,
+            "value": m.value,
+            "unit": m.unit,
+            "reference_min": m.reference_min,
+            "reference_max": m.reference_max,
+            "status": enum_for(HealthMetric.status, m.status),
+            "raw_text_snippet": m.raw_text_snippet,
+            "confidence": m.confidence,
+        }
+        for m in result.metrics
+    ]
+
+
+def _note_rows(report_id: UUID, result: ExtractionResult) -> list[dict[str, Any]]:
+    return [
+        {
+            "report_id": report_id,
+            "note_type": enum_for(TextualNote.note_type, n.note_type),
+            "content": n.content,
+            "section_heading": n.section_heading,
+        }
+        for n in result.notes
+    ]
+
+
+# ─── Writers ──────────────────────────────────────────────────────────────────
+def _apply_python_defaults(table: Table, rows: list[dict[str, Any]]) -> None:
+    """COPY bypasses SQLAlchemy, so fill client-side column defaults (e.g. uuid4 ids)."""
+    for column in table.columns:
+        default = column.default
+        if default is None:
+            continue
+        if not (getattr(default, "is_scalar", False) or getattr(default, "is_callable", False)):
+            continue
+        for row in rows:
+            if column.key not in row:
+                row[column.key] = default.arg(None) if default.is_callable else default.arg
+
+
+def _copy_escape(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_rows(session: Session, table: Table, rows: list[dict[str, Any]]) -> None:
+    """Stream rows through COPY FROM STDIN on the session's connection."""
+    _apply_python_defaults(table, rows)
+    connection = session.connection()
+    dialect = connection.dialect
+
+    columns = [c for c in table.columns if c.key in rows[0]]
+    processors = [c.type.bind_processor(dialect) for c in columns]
+
+    buffer = io.StringIO()
+    for row in rows:
+        values = []
+        for column, process in zip(columns, processors):
+            value = row.get(column.key)
+            if process is not None and value is not None:
+                value = process(value)
+            values.append(_copy_escape(value))
+        buffer.write("\t".join(values) + "\n")
+    buffer.seek(0)
+
+    column_list = ", ".join(dialect.identifier_preparer.quote(c.name) for c in columns)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table.name} ({column_list}) FROM STDIN", buffer)
+
+
+def _insert_rows(session: Session, table: Table, rows: list[dict[str, Any]]) -> None:
+    """Write rows in BULK_BATCH_SIZE chunks with the configured method."""
+    if not rows:
+        return
+
+    use_copy = (
+        db_settings.BULK_METHOD == "copy"
+        and session.get_bind().dialect.name == "postgresql"
+    )
+    batch_size = max(1, db_settings.BULK_BATCH_SIZE)
+
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        if use_copy:
+            _copy_rows(session, table, chunk)
+        else:
+            # executemany; SQLAlchemy folds it into multi-row INSERT ... VALUES
+            session.execute(insert(table), chunk)
+
+
+# ─── Main Entry Point ─────────────────────────────────────────────────────────
+def bulk_save_extractions(
+    session: Session,
+    results: list[tuple[UUID, ExtractionResult]],
+) -> tuple[int, int]:
+    """
+    Persist metrics and notes for many reports inside the caller's transaction.
+
+    Args:
+        session: Open session; the caller commits.
+        results: (report_id, ExtractionResult) pairs. Reports must already exist.
+
+    Returns:
+        (metrics_written, notes_written)
+    """
+    metric_rows: list[dict[str, Any]] = []
+    note_rows: list[dict[str, Any]] = []
+    for report_id, result in results:
+        metric_rows.extend(_metric_rows(report_id, result))
+        note_rows.extend(_note_rows(report_id, result))
+
+    _insert_rows(session, HealthMetric.__table__, metric_rows)
+    _insert_rows(session, TextualNote.__table__, note_rows)
+
+    logger.info(
+        f"Bulk saved {len(metric_rows)} metrics and {len(note_rows)} notes "
+        f"for {len(results)} reports."
+    )
+    return len(metric_rows), len(note_rows)
@@ -0,0 +1,225 @@
+"""
+Extraction Cache Service.
+Content-addressed cache of parse/OCR + data extraction results.
+
+Entries are keyed by the SHA-256 of the uploaded bytes combined with the
+parser, OCR and extractor versions and every setting that changes their
+output, so a re-sent file skips the whole pipeline while any extractor
+upgrade or OCR/PDF reconfiguration naturally misses the old entries.
+Stored as JSON under FileSettings.CACHE_DIR with size-bounded LRU eviction
+(plain data only: nothing read back from the upload directory is executed).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from app.config.settings import file_settings, ocr_settings
+from app.core.data_extractor import (
+    EXTRACTOR_VERSION,
+    ExtractedMetric,
+    ExtractedNote,
+    ExtractionResult,
+)
+from app.core.ocr_engine import OCR_VERSION, OCRResult
+from app.core.pdf_parser import PARSER_VERSION, PDFExtractionResult
+from app.utils.logger import logger
+
+
+# Settings that change what parsing/OCR produces for the same bytes
+KEYED_SETTINGS = (
+    (ocr_settings, (
+        "ENGINE", "LANGUAGE", "TESSERACT_CMD", "TESSDATA_DIR",
+        "DPI", "ADAPTIVE_DPI", "ADAPTIVE_LOW_DPI", "ADAPTIVE_MIN_CONFIDENCE",
+        "SKIP_BLANK_PAGES", "BLANK_INK_THRESHOLD",
+        "HYBRID_PDF", "HYBRID_MIN_PAGE_WORDS",
+    )),
+    (file_settings, ("PDF_FALLBACK_MIN_PAGE_WORDS",)),
+)
+
+_PARSE_RESULT_TYPES = {"pdf": PDFExtractionResult, "ocr": OCRResult}
+
+
+@dataclass
+class CachedExtraction:
+    """Everything the upload pipeline produces for one file."""
+    parse_result: Union[PDFExtractionResult, OCRResult, None]
+    extraction: ExtractionResult
+
+    def to_dict(self) -> dict:
+        parse_type = next(
+            (name for name, cls in _PARSE_RESULT_TYPES.items()
+             if isinstance(self.parse_result, cls)),
+            None,
+        )
+        return {
+            "parse_type": parse_type,
+            "parse_result": asdict(self.parse_result) if parse_type else None,
+            "extraction": asdict(self.extraction),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedExtraction":
+        parse_cls = _PARSE_RESULT_TYPES.get(data["parse_type"])
+        extraction = data["extraction"]
+        return cls(
+            parse_result=parse_cls(**data["parse_result"]) if parse_cls else None,
+            extraction=ExtractionResult(
+                metrics=[ExtractedMetric(**m) for m in extraction["metrics"]],
+                notes=[ExtractedNote(**n) for n in extraction["notes"]],
+                sections_found=extraction["sections_found"],
+            ),
+        )
+
+
+def settings_fingerprint() -> str:
+    """Stable JSON of the KEYED_SETTINGS values."""
+    values = {
+        f"{type(settings).__name__}.{name}": getattr(settings, name)
+        for settings, names in KEYED_SETTINGS
+        for name in names
+    }
+    return json.dumps(values, sort_keys=True, default=str)
+
+
+def compute_cache_key(file_bytes: bytes) -> str:
+    """SHA-256 of the file contents, salted with the pipeline versions and settings."""
+    digest = hashlib.sha256(file_bytes)
+    digest.update(
+        f"|parser={PARSER_VERSION}|ocr={OCR_VERSION}|extractor={EXTRACTOR_VERSION}".encode()
+    )
+    digest.update(f"|settings={settings_fingerprint()}".encode())
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk cache with least-recently-used eviction.
+    Recency is tracked through file mtimes, which are bumped on every hit.
+    The total size is kept in memory after one directory scan, so the
+    directory is only rescanned when a write takes it over budget.
+    """
+
+    SUFFIX = ".json"
+    # Eviction trims to this share of max_bytes, so a cache at capacity is
+    # rescanned once per ~10% of its budget written, not on every put
+    EVICT_TO = 0.9
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # unknown until the first scan
+
+    def _path(self, key: str) -> Path:
+        # Fan out by prefix so a large cache does not end up in one directory
+        return self.root / key[:2] / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[CachedExtraction]:
+        """Return the cached entry for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as fh:
+                entry = CachedExtraction.from_dict(json.load(fh))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning(f"Dropping unreadable cache entry {key[:12]}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+        logger.info(f"Extraction cache hit: {key[:12]}")
+        return entry
+
+    def put(self, key: str, entry: CachedExtraction) -> None:
+        """Store an entry atomically, then evict if the cache is over its size budget."""
+        path = self._path(key)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry.to_dict(), fh)
+            size = os.path.getsize(tmp_name)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_name, path)
+        except Exception as exc:
+            logger.warning(f"Could not write cache entry {key[:12]}: {exc}")
+            if tmp_name:
+                Path(tmp_name).unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size - replaced
+            over_budget = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Delete least-recently-used entries until under EVICT_TO of max_bytes.
+        Returns entries removed.
+        """
+        target = self.max_bytes * self.EVICT_TO
+        with self._lock:
+            entries = []
+            for path in self.root.glob(f"*/*{self.SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            # Also resyncs with entries written or deleted by other processes
+            self._total_bytes = total
+
+        if removed:
+            logger.info(f"Extraction cache evicted {removed} entries.")
+        return removed
+
+    def get_or_compute(
+        self,
+        file_bytes: bytes,
+        compute: Callable[[], CachedExtraction],
+    ) -> tuple[CachedExtraction, bool]:
+        """
+        Return (entry, cache_hit) for the file, running compute() on a miss.
+        Failed parses are not cached so a retry can succeed.
+        """
+        if not file_settings.CACHE_ENABLED:
+            return compute(), False
+
+        key = compute_cache_key(file_bytes)
+        entry = self.get(key)
+        if entry is not None:
+            return entry, True
+
+        entry = compute()
+        if entry.parse_result is None or entry.parse_result.success:
+            self.put(key, entry)
+        return entry, False
+
+
+# ─── Singleton Instance ───────────────────────────────────────────────────────
+extraction_cache = ExtractionCache(
+    root=file_settings.CACHE_DIR,
+    max_bytes=file_settings.CACHE_MAX_MB * 1024 * 1024,
+)
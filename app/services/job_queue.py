@@ -0,0 +1,273 @@
+"""
+Job Queue Service.
+Background processing of uploaded reports so Streamlit reruns never block on OCR.
+
+Jobs are persisted as JSON records (plus the uploaded bytes) under
+FileSettings.JOB_DIR, so queued work survives a browser refresh or an app
+restart. A process-wide worker pool drains the queue through the regular
+handle_report_upload pipeline; job status uses the ReportStatus values
+(pending → processing → completed | failed).
+
+The uploaded bytes are deleted as soon as a job finishes, successfully or
+not, and finished job records are purged after JOB_RETENTION_HOURS.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+from uuid import UUID, uuid4
+
+from app.config.settings import file_settings
+from app.db.models import ReportStatus
+from app.utils.logger import logger
+
+
+@dataclass
+class ReportJob:
+    """One queued report upload."""
+    id: str
+    patient_id: str
+    original_filename: str
+    status: str = ReportStatus.PENDING.value
+    report_id: Optional[str] = None
+    message: str = ""
+    metrics_count: int = 0
+    notes_count: int = 0
+    created_at: str = ""
+    updated_at: str = ""
+
+
+class JobQueue:
+    """File-backed job store with a thread worker pool."""
+
+    PURGE_INTERVAL = timedelta(minutes=10)
+
+    def __init__(self, root: Path, workers: int, retention: timedelta):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.retention = retention
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="report-job"
+        )
+        self._lock = threading.Lock()
+        self._last_purge = datetime.min
+        self.purge_expired()
+        self._recover()
+
+    # ── Persistence ───────────────────────────────────────────────────
+    def _record_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def _payload_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.bin"
+
+    def _save(self, job: ReportJob) -> None:
+        job.updated_at = datetime.utcnow().isoformat()
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(asdict(job), fh)
+        os.replace(tmp_name, self._record_path(job.id))
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        """Load a job record by ID."""
+        try:
+            data = json.loads(self._record_path(job_id).read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return ReportJob(**data)
+
+    def list_jobs(self, status: Optional[str] = None) -> list[ReportJob]:
+        """All job records, newest first, optionally filtered by status."""
+        jobs = [self.get(path.stem) for path in self.root.glob("*.json")]
+        jobs = [j for j in jobs if j and (status is None or j.status == status)]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
+
+    def recent_jobs(self, limit: int = 10) -> list[ReportJob]:
+        """The most recently created jobs, newest first."""
+        return self.list_jobs()[:limit]
+
+    def purge_expired(self) -> int:
+        """
+        Delete finished jobs last updated before the retention window, plus
+        payloads left behind by finished jobs. Returns job records removed.
+        """
+        finished = (ReportStatus.COMPLETED.value, ReportStatus.FAILED.value)
+        now = datetime.utcnow()
+        cutoff = (now - self.retention).isoformat()
+        removed = 0
+
+        with self._lock:
+            self._last_purge = now
+            for job in self.list_jobs():
+                if job.status not in finished:
+                    continue
+                self._payload_path(job.id).unlink(missing_ok=True)
+                if job.updated_at < cutoff:
+                    self._record_path(job.id).unlink(missing_ok=True)
+                    removed += 1
+            # Payloads whose record is gone, and temp files from torn writes
+            stale = (now - self.retention).timestamp()
+            for path in (*self.root.glob("*.bin"), *self.root.glob("*.tmp")):
+                orphaned = path.suffix == ".tmp" or not self._record_path(path.stem).exists()
+                try:
+                    if orphaned and path.stat().st_mtime < stale:
+                        path.unlink()
+                except FileNotFoundError:
+                    continue
+
+        if removed:
+            logger.info(f"Purged {removed} finished report jobs.")
+        return removed
+
+    def _recover(self) -> None:
+        """
+        Re-submit jobs that were pending or mid-processing when the app stopped.
+        A job that was processing may already have committed its report, so it
+        is linked to that report instead of being run (and inserted) twice.
+        """
+        unfinished = (ReportStatus.PENDING.value, ReportStatus.PROCESSING.value)
+        for job in reversed(self.list_jobs()):
+            if job.status not in unfinished:
+                continue
+            if job.status == ReportStatus.PROCESSING.value and self._link_committed_report(job):
+                continue
+            logger.info(f"Re-queueing interrupted report job {job.id}")
+            job.status = ReportStatus.PENDING.value
+            self._save(job)
+            self._pool.submit(self._run, job.id)
+
+    def _link_committed_report(self, job: ReportJob) -> bool:
+        """
+        Finish an interrupted job from the report its pipeline already wrote.
+
+        handle_report_upload does not record job IDs, so the match is a report
+        for the same patient and filename created after the job was queued
+        (both timestamps UTC). Returns False when there is none, or the
+        database cannot be checked, and the job should run again.
+        """
+        from sqlalchemy import select
+
+        from app.db.connection import get_session
+        from app.db.models import MedicalReport
+
+        query = (
+            select(MedicalReport.id, MedicalReport.status)
+            .where(
+                MedicalReport.patient_id == UUID(job.patient_id),
+                MedicalReport.original_filename == job.original_filename,
+                MedicalReport.created_at >= datetime.fromisoformat(job.created_at),
+            )
+            .order_by(MedicalReport.created_at)
+            .limit(1)
+        )
+        try:
+            with get_session() as session:
+                row = session.execute(query).first()
+        except Exception as exc:
+            logger.warning(f"Could not check report job {job.id} for a committed report: {exc}")
+            return False
+        if row is None:
+            return False
+
+        report_id, report_status = row
+        job.report_id = str(report_id)
+        if report_status == ReportStatus.COMPLETED:
+            job.status = ReportStatus.COMPLETED.value
+            job.message = "Report was saved before the app restarted."
+        else:
+            job.status = ReportStatus.FAILED.value
+            job.message = "Interrupted while processing; the partial report was kept."
+        logger.info(f"Report job {job.id} already wrote report {report_id}; not re-running.")
+        self._save(job)
+        self._payload_path(job.id).unlink(missing_ok=True)
+        return True
+
+    # ── Queue API ─────────────────────────────────────────────────────
+    def enqueue(self, patient_id: UUID, file_bytes: bytes, original_filename: str) -> str:
+        """Persist the upload and schedule it. Returns the job ID immediately."""
+        job = ReportJob(
+            id=uuid4().hex,
+            patient_id=str(patient_id),
+            original_filename=original_filename,
+            created_at=datetime.utcnow().isoformat(),
+        )
+        self._payload_path(job.id).write_bytes(file_bytes)
+        self._save(job)
+        self._pool.submit(self._run, job.id)
+        logger.info(f"Queued report job {job.id} ({original_filename})")
+        return job.id
+
+    def _run(self, job_id: str) -> None:
+        """Worker body: process one job through the upload pipeline."""
+        from app.controllers.report_controller import handle_report_upload
+
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job.status != ReportStatus.PENDING.value:
+                return
+            job.status = ReportStatus.PROCESSING.value
+            self._save(job)
+
+        try:
+            file_bytes = self._payload_path(job_id).read_bytes()
+            result = handle_report_upload(
+                patient_id=UUID(job.patient_id),
+                file_bytes=file_bytes,
+                original_filename=job.original_filename,
+            )
+            job.status = (
+                ReportStatus.COMPLETED.value if result.success else ReportStatus.FAILED.value
+            )
+            job.message = result.message
+            job.report_id = str(result.report_id) if result.report_id else None
+            job.metrics_count = result.metrics_count or 0
+            job.notes_count = result.notes_count or 0
+        except Exception as exc:
+            logger.error(f"Report job {job_id} failed: {exc}")
+            job.status = ReportStatus.FAILED.value
+            job.message = str(exc)
+
+        self._save(job)
+        # The upload is only needed while the job can still run
+        self._payload_path(job_id).unlink(missing_ok=True)
+        if datetime.utcnow() - self._last_purge > self.PURGE_INTERVAL:
+            self.purge_expired()
+
+
+# ─── Process-wide Instance ────────────────────────────────────────────────────
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the shared JobQueue, starting its workers on first use."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(
+                root=file_settings.JOB_DIR,
+                workers=file_settings.JOB_WORKERS,
+                retention=timedelta(hours=file_settings.JOB_RETENTION_HOURS),
+            )
+        return _job_queue
+
+
+def enqueue_report(patient_id: UUID, file_bytes: bytes, original_filename: str) -> str:
+    """Queue a report upload for background processing. Returns the job ID."""
+    return get_job_queue().enqueue(patient_id, file_bytes, original_filename)
+
+
+def get_job(job_id: str) -> Optional[ReportJob]:
+    """Current state of a queued job."""
+    return get_job_queue().get(job_id)
+
+
+def list_recent_jobs(limit: int = 10) -> list[ReportJob]:
+    """Most recent jobs from the persistent queue (survives browser refreshes)."""
+    return get_job_queue().recent_jobs(limit)
@@ -0,0 +1,215 @@
+"""
+Re-extraction Job.
+Refreshes health_metrics / textual_notes from stored text after extractor upgrades.
+
+    python -m app.services.reextract [--chunk-size 500] [--workers 8] [--force]
+
+Instead of re-uploading (and re-running OCR), the stored
+extracted_data.raw_text is streamed from the database in keyset-ordered
+chunks, re-run through extract_data_from_text on a process pool, and only the
+rows that actually changed are written. Each processed report is stamped with
+EXTRACTOR_VERSION, so an interrupted run simply continues with the reports
+that are still behind.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select, update
+
+from app.core.data_extractor import (
+    EXTRACTOR_VERSION,
+    ExtractedMetric,
+    ExtractionResult,
+    extract_data_from_text,
+)
+from app.db.connection import get_session
+from app.db.models import ExtractedData, HealthMetric, MedicalReport, TextualNote
+from app.services.bulk_persistence import bulk_save_extractions, enum_for
+from app.utils.logger import logger
+
+
+# HealthMetric columns compared when diffing; metric_key is the identity
+METRIC_FIELDS = (
+    "metric_name", "value", "unit", "reference_min", "reference_max",
+    "status", "raw_text_snippet", "confidence",
+)
+
+
+@dataclass
+class ReextractStats:
+    reports: int = 0
+    metrics_inserted: int = 0
+    metrics_updated: int = 0
+    metrics_deleted: int = 0
+    notes_replaced: int = 0
+    unchanged_reports: int = 0
+
+
+# ─── Streaming ────────────────────────────────────────────────────────────────
+def iter_stored_text(chunk_size: int, force: bool = False) -> Iterator[list[tuple[UUID, str]]]:
+    """
+    Yield (report_id, raw_text) chunks ordered by report_id (keyset pagination).
+    Without force, only reports not yet stamped with EXTRACTOR_VERSION.
+    """
+    last_id: Optional[UUID] = None
+    while True:
+        query = (
+            select(ExtractedData.report_id, ExtractedData.raw_text)
+            .join(MedicalReport, MedicalReport.id == ExtractedData.report_id)
+        )
+        if not force:
+            query = query.where(or_(
+                MedicalReport.extractor_version.is_(None),
+                MedicalReport.extractor_version != EXTRACTOR_VERSION,
+            ))
+        if last_id is not None:
+            query = query.where(ExtractedData.report_id > last_id)
+        query = query.order_by(ExtractedData.report_id).limit(chunk_size)
+
+        with get_session() as session:
+            rows = [(report_id, raw_text or "") for report_id, raw_text in session.execute(query).all()]
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def _extract(row: tuple[UUID, str]) -> tuple[UUID, ExtractionResult]:
+    """Pool worker: re-run extraction on one report's stored text."""
+    report_id, raw_text = row
+    return report_id, extract_data_from_text(raw_text)
+
+
+# ─── Diff & Upsert ────────────────────────────────────────────────────────────
+def _metric_values(metric: ExtractedMetric) -> dict:
+    values = {name: getattr(metric, name) for name in METRIC_FIELDS}
+    values["status"] = enum_for(HealthMetric.status, metric.status)
+    return values
+
+
+def _apply_chunk(results: list[tuple[UUID, ExtractionResult]], stats: ReextractStats) -> None:
+    """Diff fresh results against stored rows and write only the changes, in one transaction."""
+    report_ids = [report_id for report_id, _ in results]
+
+    with get_session() as session:
+        stored_metrics: dict[UUID, dict[str, HealthMetric]] = {rid: {} for rid in report_ids}
+        for metric in session.scalars(
+            select(HealthMetric).where(HealthMetric.report_id.in_(report_ids))
+        ):
+            stored_metrics[metric.report_id][metric.metric_key] = metric
+
+        stored_notes: dict[UUID, list[tuple]] = {rid: [] for rid in report_ids}
+        for note in session.scalars(
+            select(TextualNote).where(TextualNote.report_id.in_(report_ids))
+        ):
+            stored_notes[note.report_id].append(
+                (note.note_type, note.content, note.section_heading or "")
+            )
+
+        inserts: list[tuple[UUID, ExtractionResult]] = []
+        notes_to_replace: list[UUID] = []
+
+        for report_id, result in results:
+            existing = stored_metrics[report_id]
+            new_metrics: list[ExtractedMetric] = []
+            changed = False
+
+            for metric in result.metrics:
+                row = existing.pop(metric.metric_key, None)
+                if row is None:
+                    new_metrics.append(metric)
+                    continue
+                row_changed = False
+                for name, value in _metric_values(metric).items():
+                    if getattr(row, name) != value:
+                        setattr(row, name, value)
+                        row_changed = True
+                if row_changed:
+                    stats.metrics_updated += 1
+                    changed = True
+
+            # Metrics the new extractor no longer finds
+            for row in existing.values():
+                session.delete(row)
+            stats.metrics_deleted += len(existing)
+            stats.metrics_inserted += len(new_metrics)
+
+            fresh_notes = sorted((n.note_type, n.content, n.section_heading or "") for n in result.notes)
+            notes_changed = fresh_notes != sorted(stored_notes[report_id])
+            if notes_changed:
+                notes_to_replace.append(report_id)
+                stats.notes_replaced += 1
+
+            if new_metrics or notes_changed:
+                inserts.append((
+                    report_id,
+                    ExtractionResult(
+                        metrics=new_metrics,
+                        notes=result.notes if notes_changed else [],
+                    ),
+                ))
+            if not (changed or existing or new_metrics or notes_changed):
+                stats.unchanged_reports += 1
+
+        if notes_to_replace:
+            session.execute(
+                delete(TextualNote).where(TextualNote.report_id.in_(notes_to_replace))
+            )
+        session.flush()
+        bulk_save_extractions(session, inserts)
+
+        session.execute(
+            update(MedicalReport)
+            .where(MedicalReport.id.in_(report_ids))
+            .values(extractor_version=EXTRACTOR_VERSION)
+        )
+        session.commit()
+
+    stats.reports += len(results)
+
+
+# ─── Main Entry Point ─────────────────────────────────────────────────────────
+def run_reextraction(chunk_size: int = 500, workers: int = 4, force: bool = False) -> ReextractStats:
+    """Re-extract every stored report that is behind EXTRACTOR_VERSION."""
+    stats = ReextractStats()
+    started = time.perf_counter()
+    logger.info(f"Re-extraction to extractor v{EXTRACTOR_VERSION} with {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        for rows in iter_stored_text(chunk_size, force=force):
+            results = list(pool.map(_extract, rows, chunksize=max(1, len(rows) // (workers * 4))))
+            _apply_chunk(results, stats)
+            rate = stats.reports / max(time.perf_counter() - started, 1e-6)
+            logger.info(f"Re-extracted {stats.reports} reports ({rate:.0f}/s)")
+
+    logger.info(f"Re-extraction finished: {stats}")
+    return stats
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.reextract",
+        description="Re-run data extraction on stored report text.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--force", action="store_true",
+                        help="Also re-extract reports already at the current version")
+    args = parser.parse_args(argv)
+
+    run_reextraction(
+        chunk_size=max(1, args.chunk_size),
+        workers=args.workers,
+        force=args.force,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
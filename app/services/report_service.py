@@ -0,0 +1,154 @@
+"""
+Report Service.
+Query API for patients and medical reports.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_
+
+from app.db.connection import get_session
+from app.db.models import MedicalReport, Patient, ReportStatus
+
+
+def search_patients(name_query: str = "", limit: int = 50) -> list[tuple[UUID, str]]:
+    """
+    (id, full_name) of at most `limit` patients whose name contains
+    name_query (case-insensitive), ordered by name. For pickers that must not
+    load the whole patient table on every rerun.
+    """
+    query = select(Patient.id, Patient.full_name)
+    name_query = name_query.strip()
+    if name_query:
+        escaped = name_query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query = query.where(Patient.full_name.ilike(f"%{escaped}%", escape="\\"))
+    query = query.order_by(Patient.full_name, Patient.id).limit(limit)
+
+    with get_session() as session:
+        return [(patient_id, full_name) for patient_id, full_name in session.execute(query).all()]
+
+
+def get_completed_reports_with_patients(
+    patient_id: Optional[UUID] = None,
+    limit: int = 200,
+) -> list[tuple[MedicalReport, str]]:
+    """
+    Most recent completed reports joined with their patient's name,
+    optionally for one patient only.
+
+    One round trip regardless of patient count, served by the
+    (status, created_at) index from migration 002. At most `limit` rows are
+    returned; callers can ask for limit + 1 to tell whether older reports
+    were cut off.
+
+    Returns:
+        List of (MedicalReport, patient full_name), newest first.
+    """
+    query = (
+        select(MedicalReport, Patient.full_name)
+        .join(Patient, Patient.id == MedicalReport.patient_id)
+        .where(MedicalReport.status == ReportStatus.COMPLETED)
+    )
+    if patient_id:
+        query = query.where(MedicalReport.patient_id == patient_id)
+    query = query.order_by(MedicalReport.created_at.desc()).limit(limit)
+
+    with get_session() as session:
+        rows = session.execute(query).all()
+        return [(report, full_name) for report, full_name in rows]
+
+
+# ─── Paginated Report Listing ─────────────────────────────────────────────────
+@dataclass
+class ReportPage:
+    """One keyset page of reports, newest first."""
+    items: list[tuple[MedicalReport, str]] = field(default_factory=list)
+    next_cursor: Optional[str] = None   # None when this is the last page
+
+
+def _encode_cursor(report: MedicalReport) -> str:
+    return f"{report.created_at.isoformat()}|{report.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    created_at, report_id = cursor.split("|", 1)
+    return datetime.fromisoformat(created_at), UUID(report_id)
+
+
+def _report_filters(
+    patient_id: Optional[UUID],
+    status: Optional[ReportStatus],
+    date_from: Optional[date],
+    date_to: Optional[date],
+) -> list:
+    filters = []
+    if patient_id:
+        filters.append(MedicalReport.patient_id == patient_id)
+    if status:
+        filters.append(MedicalReport.status == status)
+    if date_from:
+        filters.append(MedicalReport.created_at >= datetime.combine(date_from, time.min))
+    if date_to:
+        filters.append(MedicalReport.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+    return filters
+
+
+def get_reports_page(
+    patient_id: Optional[UUID] = None,
+    status: Optional[ReportStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 25,
+) -> ReportPage:
+    """
+    Fetch one page of reports (joined with patient names) using keyset pagination.
+
+    Ordering is (created_at, id) descending; `cursor` is the next_cursor of the
+    previous page. Filtering, ordering and limiting all happen in the database,
+    so cost does not grow with table size.
+    """
+    query = (
+        select(MedicalReport, Patient.full_name)
+        .join(Patient, Patient.id == MedicalReport.patient_id)
+        .where(*_report_filters(patient_id, status, date_from, date_to))
+    )
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(MedicalReport.created_at, MedicalReport.id) < (cursor_ts, cursor_id)
+        )
+    query = query.order_by(
+        MedicalReport.created_at.desc(), MedicalReport.id.desc()
+    ).limit(page_size + 1)
+
+    with get_session() as session:
+        rows = [(report, full_name) for report, full_name in session.execute(query).all()]
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    return ReportPage(
+        items=rows,
+        next_cursor=_encode_cursor(rows[-1][0]) if has_more and rows else None,
+    )
+
+
+def count_reports_by_status(
+    patient_id: Optional[UUID] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> dict[str, int]:
+    """Report counts per status value for the given filters (single GROUP BY)."""
+    query = (
+        select(MedicalReport.status, func.count())
+        .where(*_report_filters(patient_id, None, date_from, date_to))
+        .group_by(MedicalReport.status)
+    )
+    with get_session() as session:
+        return {
+            (s.value if hasattr(s, "value") else str(s)): n
+            for s, n in session.execute(query).all()
+        }
@@ -27,6 +27,22 @@ STATUS_ICON = {
 }
 
 
+def _render_stage_timings(stage_timings: dict) -> None:
+    """Per-stage processing breakdown (ms) plus pipeline counters."""
+    timings = stage_timings.get("timings_ms", {})
+    counters = stage_timings.get("counters", {})
+
+    st.caption("PROCESSING BREAKDOWN")
+    rows = [
+        {"Stage": stage, "Time (ms)": round(ms, 1)}
+        for stage, ms in sorted(timings.items(), key=lambda kv: kv[1], reverse=True)
+    ]
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    if counters:
+        st.caption("  ·  ".join(f"{name}: **{value}**" for name, value in sorted(counters.items())))
+
+
 def render_report_row(
     report: MedicalReport,
     patient_name: str,
@@ -80,6 +96,10 @@ def render_report_row(
         if report.page_count:
             st.write(f"**Pages:** {report.page_count}")
 
+        stage_timings = getattr(report, "stage_timings", None) or {}
+        if stage_timings.get("timings_ms"):
+            _render_stage_timings(stage_timings)
+
         if report.error_message:
             st.error(f"**Error:** {report.error_message}")
 
@@ -92,13 +112,17 @@ def render_report_row(
 
 def render_report_summary_metrics(reports: list[MedicalReport]) -> None:
     """Render 4 summary metric boxes above a report list."""
-    total     = len(reports)
-    completed = sum(1 for r in reports if r.status == ReportStatus.COMPLETED)
-    pending   = sum(1 for r in reports if r.status == ReportStatus.PENDING)
-    failed    = sum(1 for r in reports if r.status == ReportStatus.FAILED)
+    counts: dict[str, int] = {}
+    for r in reports:
+        if r.status:
+            counts[r.status.value] = counts.get(r.status.value, 0) + 1
+    render_report_status_counts(counts)
+
 
+def render_report_status_counts(counts: dict[str, int]) -> None:
+    """Render the 4 summary metric boxes from precomputed per-status counts."""
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("📄 Total",     total)
-    c2.metric("✅ Completed", completed)
-    c3.metric("⏳ Pending",   pending)
-    c4.metric("❌ Failed",    failed)
\ No newline at end of file
+    c1.metric("📄 Total",     sum(counts.values()))
+    c2.metric("✅ Completed", counts.get(ReportStatus.COMPLETED.value, 0))
+    c3.metric("⏳ Pending",   counts.get(ReportStatus.PENDING.value, 0))
+    c4.metric("❌ Failed",    counts.get(ReportStatus.FAILED.value, 0))
\ No newline at end of file
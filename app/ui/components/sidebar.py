@@ -5,7 +5,7 @@ Import and call render_sidebar() at the top of each page.
 """
 
 import streamlit as st
-from app.db.connection import check_connection
+from app.db.health import is_db_available
 
 
 def render_sidebar(active_page: str = "") -> None:
@@ -33,7 +33,7 @@ def render_sidebar(active_page: str = "") -> None:
         st.divider()
 
         # ── Database Status ───────────────────────────────────────────
-        db_ok = check_connection()
+        db_ok = is_db_available()
         if db_ok:
             st.markdown(
                 '<div style="background:#E8F5E9;border-radius:8px;padding:8px 12px;'
@@ -0,0 +1,85 @@
+"""
+Stage Timing Utilities.
+Lightweight per-stage timers and counters for the processing hot path.
+
+A StageTimings recorder is activated with timing_scope(); core modules call
+record_stage() / incr_counter() without threading it through their
+signatures. Outside an active scope those calls are no-ops.
+
+    with timing_scope() as timings:
+        result = parse_pdf(path)
+        extraction = extract_data_from_text(result.raw_text)
+    report.stage_timings = timings.to_dict()
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+@dataclass
+class StageTimings:
+    """Accumulated wall time per stage (ms) and event counters."""
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def add_time(self, stage: str, elapsed_ms: float) -> None:
+        self.timings_ms[stage] = self.timings_ms.get(stage, 0.0) + elapsed_ms
+
+    def incr(self, counter: str, amount: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def merge(self, other: dict) -> None:
+        """Fold in a to_dict() snapshot, e.g. one returned by a pool worker."""
+        for stage, elapsed in other.get("timings_ms", {}).items():
+            self.add_time(stage, elapsed)
+        for counter, amount in other.get("counters", {}).items():
+            self.incr(counter, amount)
+
+    def to_dict(self) -> dict:
+        return {
+            "timings_ms": {k: round(v, 2) for k, v in self.timings_ms.items()},
+            "counters": dict(self.counters),
+        }
+
+
+_current: ContextVar[Optional[StageTimings]] = ContextVar("stage_timings", default=None)
+
+
+def current_timings() -> Optional[StageTimings]:
+    """The recorder of the innermost active timing_scope(), if any."""
+    return _current.get()
+
+
+@contextmanager
+def timing_scope(timings: Optional[StageTimings] = None) -> Iterator[StageTimings]:
+    """Activate a recorder for the enclosed block."""
+    timings = timings or StageTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def record_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed block into the active recorder."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_time(stage, (time.perf_counter() - start) * 1000)
+
+
+def incr_counter(counter: str, amount: int = 1) -> None:
+    """Bump a counter on the active recorder (no-op outside a scope)."""
+    timings = _current.get()
+    if timings is not None:
+        timings.incr(counter, amount)
@@ -0,0 +1,8 @@
+"""
+Benchmarks for the AI-NutriCare extraction pipeline.
+
+    python -m benchmarks.run --docs 200 --pages 3 --out bench.json
+
+corpus.py generates synthetic lab reports (text, text PDFs, scanned PDFs);
+run.py times parse_pdf, run_ocr and extract_data_from_text over them.
+"""
@@ -0,0 +1,174 @@
+"""
+Synthetic Report Corpus.
+Generates lab reports in the style of sample_reports/ for benchmarking.
+
+Every knob is explicit so runs are reproducible: metric count per report,
+OCR-style character noise, narrative pages, and whether PDFs carry a text
+layer or are rasterised ("scanned") pages rendered locally through PyMuPDF.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.core.data_extractor import REFERENCE_RANGES
+
+
+# metric_key → label as it appears on a printed lab report
+METRIC_LABELS: dict[str, str] = {
+    "blood_glucose_fasting":      "Fasting Blood Glucose",
+    "blood_glucose_postprandial": "Post-prandial Blood Sugar",
+    "hba1c":                      "HbA1c",
+    "total_cholesterol":          "Total Cholesterol",
+    "ldl_cholesterol":            "LDL Cholesterol",
+    "hdl_cholesterol":            "HDL Cholesterol",
+    "triglycerides":              "Triglycerides",
+    "bmi":                        "BMI",
+    "hemoglobin":                 "Hemoglobin",
+    "creatinine":                 "Creatinine",
+    "uric_acid":                  "Uric Acid",
+    "tsh":                        "TSH",
+    "vitamin_d":                  "Vitamin D",
+    "vitamin_b12":                "Vitamin B12",
+}
+
+FIRST_NAMES = ["John", "Priya", "Maria", "Wei", "Fatima", "David", "Aisha", "Carlos"]
+LAST_NAMES = ["Doe", "Sharma", "Garcia", "Chen", "Khan", "Smith", "Okafor", "Silva"]
+
+NARRATIVE = [
+    "Patient reports mild fatigue over the past two weeks with no chest pain.",
+    "Advised to reduce refined carbohydrate intake and increase daily walking.",
+    "Follow-up in three months with repeat lipid profile and HbA1c.",
+    "No known drug allergies. Family history of type 2 diabetes.",
+    "Physical examination unremarkable apart from mild central obesity.",
+    "Continue current medication; monitor fasting sugars at home.",
+    "Diet counselling provided regarding sodium and saturated fat intake.",
+    "Impression: metabolic syndrome, to be managed with lifestyle changes.",
+]
+
+# Typical OCR confusions used to inject noise
+OCR_CONFUSIONS = {"l": "1", "O": "0", "o": "0", "S": "5", "e": "c", "i": "l", "B": "8"}
+
+
+@dataclass
+class CorpusConfig:
+    """Knobs for synthetic report generation."""
+    docs: int = 100
+    metrics_per_report: int = 10    # capped at the number of known metrics
+    noise: float = 0.0              # probability of an OCR-style char swap
+    pages: int = 2                  # 1 lab page + (pages - 1) narrative pages
+    scanned_ratio: float = 0.0      # share of PDFs rasterised without a text layer
+    scan_dpi: int = 150
+    seed: int = 42
+
+
+@dataclass
+class SyntheticReport:
+    """One generated report, with the pages as plain text."""
+    name: str
+    pages: list[str] = field(default_factory=list)
+    metric_keys: list[str] = field(default_factory=list)
+    scanned: bool = False
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(self.pages)
+
+
+def _value_for(metric_key: str, rng: random.Random) -> float:
+    low, high, _unit = REFERENCE_RANGES[metric_key]
+    low = low or high * 0.3
+    return round(rng.uniform(low * 0.7, high * 1.6), 1)
+
+
+def _add_noise(text: str, noise: float, rng: random.Random) -> str:
+    if noise <= 0:
+        return text
+    return "".join(
+        OCR_CONFUSIONS[ch] if ch in OCR_CONFUSIONS and rng.random() < noise else ch
+        for ch in text
+    )
+
+
+def generate_report(index: int, config: CorpusConfig, rng: random.Random) -> SyntheticReport:
+    """Build one synthetic lab report."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    report_date = date(2024, 1, 1) + timedelta(days=rng.randint(0, 700))
+    keys = rng.sample(list(METRIC_LABELS), min(config.metrics_per_report, len(METRIC_LABELS)))
+
+    lab_lines = [
+        "CITY DIAGNOSTIC LABORATORY",
+        f"Patient Name: {name}",
+        f"Report Date: {report_date:%d/%m/%Y}",
+        f"Sample ID: LAB-{index:06d}",
+        "",
+        "LAB RESULTS:",
+    ]
+    for key in keys:
+        unit = REFERENCE_RANGES[key][2]
+        lab_lines.append(f"{METRIC_LABELS[key]}: {_value_for(key, rng)} {unit}")
+
+    systolic, diastolic = rng.randint(100, 170), rng.randint(60, 105)
+    lab_lines.append(f"Blood Pressure: {systolic}/{diastolic} mmHg")
+    keys += ["systolic_bp", "diastolic_bp"]
+
+    pages = [_add_noise("\n".join(lab_lines), config.noise, rng)]
+
+    for page_num in range(2, config.pages + 1):
+        heading = "DOCTOR NOTES:" if page_num == 2 else f"CLINICAL NOTES (page {page_num}):"
+        body = " ".join(rng.choice(NARRATIVE) for _ in range(rng.randint(8, 20)))
+        pages.append(_add_noise(f"{heading}\n{body}", config.noise, rng))
+
+    return SyntheticReport(
+        name=f"report_{index:05d}",
+        pages=pages,
+        metric_keys=keys,
+        scanned=rng.random() < config.scanned_ratio,
+    )
+
+
+def generate_corpus(config: CorpusConfig) -> list[SyntheticReport]:
+    """Deterministically generate config.docs reports."""
+    rng = random.Random(config.seed)
+    return [generate_report(i, config, rng) for i in range(config.docs)]
+
+
+# ─── PDF Rendering ────────────────────────────────────────────────────────────
+def render_pdf(report: SyntheticReport, out_path: Path, scan_dpi: int = 150) -> Path:
+    """
+    Write the report as a PDF with PyMuPDF.
+    Scanned reports are rasterised page by page and re-embedded as images,
+    so the output has no text layer and must go through OCR.
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for page_text in report.pages:
+        page = doc.new_page(width=595, height=842)  # A4 in points
+        page.insert_textbox(fitz.Rect(50, 50, 545, 800), page_text, fontsize=10)
+
+    if report.scanned:
+        scanned = fitz.open()
+        mat = fitz.Matrix(scan_dpi / 72, scan_dpi / 72)
+        for page in doc:
+            pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY)
+            new_page = scanned.new_page(width=page.rect.width, height=page.rect.height)
+            new_page.insert_image(new_page.rect, pixmap=pix)
+        doc.close()
+        doc = scanned
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(str(out_path))
+    doc.close()
+    return out_path
+
+
+def write_corpus(reports: list[SyntheticReport], out_dir: Path, scan_dpi: int = 150) -> list[Path]:
+    """Write each report as .txt plus .pdf under out_dir. Returns the PDF paths."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    pdf_paths = []
+    for report in reports:
+        (out_dir / f"{report.name}.txt").write_text(report.text, encoding="utf-8")
+        pdf_paths.append(render_pdf(report, out_dir / f"{report.name}.pdf", scan_dpi))
+    return pdf_paths
@@ -0,0 +1,179 @@
+"""
+Pipeline Benchmark Runner.
+Times each extraction stage over a synthetic corpus and emits JSON.
+
+    python -m benchmarks.run --docs 200 --pages 3 --scanned-ratio 0.2 --out bench.json
+
+Stages:
+    extract       → extract_data_from_text on every report's text
+    extract_pages → extract_data_from_pages on the same reports, page by page
+    parse         → parse_pdf on PDFs with a text layer
+    ocr           → run_ocr(..., "pdf") on scanned PDFs
+
+Per stage: docs, docs/sec, p50/p95/max latency (ms) and peak RSS (MB). Each
+stage runs in a fresh child process, so its peak RSS is its own high-water
+mark (corpus generation included, OCR pool workers excluded) rather than
+that of whichever stage ran before it.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from benchmarks.corpus import CorpusConfig, generate_corpus, write_corpus
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def time_stage(name: str, items: list, fn: Callable) -> dict:
+    """Run fn over items, timing each call."""
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "stage": name,
+        "docs": len(items),
+        "docs_per_sec": round(len(items) / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+    }
+
+
+def _run_stage(name: str, config: CorpusConfig, pdf_paths: list[Path]) -> dict:
+    """Run one stage; called in its own child process by run_benchmarks()."""
+    if name == "extract":
+        from app.core.data_extractor import extract_data_from_text
+
+        found = expected = 0
+
+        def _extract(report) -> None:
+            nonlocal found, expected
+            extraction = extract_data_from_text(report.text)
+            expected += len(report.metric_keys)
+            found += len({m.metric_key for m in extraction.metrics} & set(report.metric_keys))
+
+        stage = time_stage("extract", generate_corpus(config), _extract)
+        stage["metric_recall"] = round(found / expected, 4) if expected else None
+    elif name == "extract_pages":
+        from app.core.data_extractor import extract_data_from_pages
+
+        stage = time_stage(
+            "extract_pages", generate_corpus(config), lambda r: extract_data_from_pages(r.pages)
+        )
+    elif name == "parse":
+        from app.core.pdf_parser import parse_pdf
+
+        stage = time_stage("parse", pdf_paths, parse_pdf)
+    else:
+        from app.core.ocr_engine import run_ocr
+
+        stage = time_stage("ocr", pdf_paths, lambda p: run_ocr(p, "pdf"))
+
+    stage["peak_rss_mb"] = _peak_rss_mb()
+    return stage
+
+
+def run_benchmarks(config: CorpusConfig, stages: list[str], workdir: Path) -> dict:
+    """Generate the corpus, run the selected stages and return the JSON report."""
+    stage_inputs: dict[str, list[Path]] = {
+        name: [] for name in ("extract", "extract_pages") if name in stages
+    }
+
+    if "parse" in stages or "ocr" in stages:
+        reports = generate_corpus(config)
+        pdf_paths = write_corpus(reports, workdir, scan_dpi=config.scan_dpi)
+        text_pdfs = [p for p, r in zip(pdf_paths, reports) if not r.scanned]
+        scanned_pdfs = [p for p, r in zip(pdf_paths, reports) if r.scanned]
+        del reports
+
+        if "parse" in stages and text_pdfs:
+            stage_inputs["parse"] = text_pdfs
+        if "ocr" in stages and scanned_pdfs:
+            stage_inputs["ocr"] = scanned_pdfs
+
+    results: list[dict] = []
+    context = multiprocessing.get_context("spawn")
+    for name, pdf_paths in stage_inputs.items():
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(_run_stage, name, config, pdf_paths).result())
+
+    return {
+        "config": vars(config),
+        "stages": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark the AI-NutriCare extraction pipeline.",
+    )
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--metrics", type=int, default=10, help="Metrics per report")
+    parser.add_argument("--noise", type=float, default=0.0, help="OCR-style char swap rate")
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--scanned-ratio", type=float, default=0.0)
+    parser.add_argument("--scan-dpi", type=int, default=150)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stages", default="extract,extract_pages,parse,ocr",
+                        help="Comma-separated subset of extract,extract_pages,parse,ocr")
+    parser.add_argument("--workdir", type=Path, default=None,
+                        help="Where PDFs are written (default: a temp dir)")
+    parser.add_argument("--out", type=Path, default=None, help="JSON output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    config = CorpusConfig(
+        docs=args.docs,
+        metrics_per_report=args.metrics,
+        noise=args.noise,
+        pages=max(1, args.pages),
+        scanned_ratio=args.scanned_ratio,
+        scan_dpi=args.scan_dpi,
+        seed=args.seed,
+    )
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+
+    if args.workdir:
+        report = run_benchmarks(config, stages, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="nutricare_bench_") as tmp:
+            report = run_benchmarks(config, stages, Path(tmp))
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
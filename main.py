@@ -7,8 +7,10 @@ This file is intentionally thin. All UI lives in pages/ and app/ui/components/.
 
 import streamlit as st
 
-from app.config.settings import app_settings
-from app.db.connection import check_connection, create_all_tables
+from app.config.settings import app_settings, ocr_settings
+from app.core.ocr_engine import warm_up_easyocr
+from app.db.connection import create_all_tables
+from app.db.health import is_db_available
 from app.ui.styles import inject_styles
 from app.ui.components.sidebar import render_sidebar
 from app.utils.logger import logger
@@ -61,8 +63,17 @@ for col, (icon, title, desc) in zip([col1, col2, col3, col4], cards):
 st.divider()
 st.caption("👈 Use the sidebar to navigate between pages.")
 
+# ── OCR Warm Start (once per process) ─────────────────────────────────────────
+@st.cache_resource(show_spinner="Loading OCR models…")
+def _warm_up_ocr() -> bool:
+    return warm_up_easyocr()
+
+
+if ocr_settings.EASYOCR_WARM_START:
+    _warm_up_ocr()
+
 # ── DB Init (once on startup) ─────────────────────────────────────────────────
-if check_connection():
+if is_db_available():
     try:
         create_all_tables()
     except Exception as exc:
@@ -11,16 +11,14 @@ All rendering logic lives in app/ui/components/.
 """
 
 import streamlit as st
+from collections import Counter
 from typing import Optional
 from uuid import UUID
 
-from app.db.connection import check_connection
-from app.db.models import MedicalReport, ReportStatus
-from app.services.report_service import (
-    get_reports_for_patient,
-    get_all_patients,
-)
-from app.controllers.report_controller import handle_report_upload
+from app.db.health import is_db_available
+from app.db.models import MedicalReport
+from app.services.report_service import get_completed_reports_with_patients, search_patients
+from app.services.job_queue import enqueue_report
 from app.ui.styles import inject_styles
 from app.ui.components.sidebar import render_sidebar
 from app.ui.components.upload_panel import render_upload_panel
@@ -40,7 +38,7 @@ inject_styles()
 render_sidebar(active_page="Dashboard")
 
 # ── Guard: DB must be connected ───────────────────────────────────────────────
-if not check_connection():
+if not is_db_available():
     st.error("⚠️ Database is not connected. Configure `.env` and restart.")
     st.stop()
 
@@ -57,31 +55,63 @@ st.markdown(
 
 # ── Report Selector (above panels) ───────────────────────────────────────────
 # Let the user pick which completed report drives the insights + diet plan panels.
-patients = get_all_patients()
-patient_name_map = {p.id: p.full_name for p in patients}
-
-# Gather all completed reports across all patients for the selector
-all_completed: list[MedicalReport] = []
-for p in patients:
-    all_completed.extend(
-        [r for r in get_reports_for_patient(p.id) if r.status == ReportStatus.COMPLETED]
+# Completed reports joined with patient names in a single query; the list is
+# capped, so a patient filter keeps older reports reachable. The filter only
+# loads the patients matching its search box, never the whole table.
+SELECTOR_LIMIT = 200
+PATIENT_LOOKUP_LIMIT = 50
+
+col_patient, col_report = st.columns([1, 3])
+with col_patient:
+    patient_query = st.text_input(
+        "Find patient", key="dashboard_patient_search", placeholder="Name contains…"
+    )
+    patient_names = dict(search_patients(patient_query, limit=PATIENT_LOOKUP_LIMIT))
+    name_counts = Counter(patient_names.values())
+
+    def _patient_label(patient_id: Optional[UUID]) -> str:
+        if patient_id is None:
+            return "All Patients"
+        name = patient_names[patient_id]
+        # Same-named patients stay distinct entries; tell them apart by ID
+        return f"{name} ({str(patient_id)[:8]})" if name_counts[name] > 1 else name
+
+    sel_patient_id = st.selectbox(
+        "Patient",
+        options=[None, *patient_names],
+        format_func=_patient_label,
+        key="dashboard_patient_filter",
     )
 
+all_completed = get_completed_reports_with_patients(
+    patient_id=sel_patient_id, limit=SELECTOR_LIMIT + 1
+)
+truncated = len(all_completed) > SELECTOR_LIMIT
+all_completed = all_completed[:SELECTOR_LIMIT]
+
 selected_report: Optional[MedicalReport] = None
 
 if all_completed:
     report_options = {
-        f"{r.original_filename}  ·  {patient_name_map.get(r.patient_id, '?')}  "
+        f"{r.original_filename}  ·  {patient_name or '?'}  "
         f"·  {r.created_at.strftime('%b %d') if r.created_at else ''}": r
-        for r in all_completed
+        for r, patient_name in all_completed
     }
-    sel_label = st.selectbox(
-        "Active Report",
-        options=list(report_options.keys()),
-        key="dashboard_report_selector",
-        help="Select a processed report to populate the insights and diet plan panels",
-    )
+    with col_report:
+        sel_label = st.selectbox(
+            "Active Report",
+            options=list(report_options.keys()),
+            key="dashboard_report_selector",
+            help="Select a processed report to populate the insights and diet plan panels",
+        )
     selected_report = report_options[sel_label]
+    if truncated:
+        st.caption(
+            f"Showing the {SELECTOR_LIMIT} most recent completed reports — "
+            "pick a patient to reach older ones."
+        )
+elif sel_patient_id is not None:
+    st.info(f"No processed reports for {_patient_label(sel_patient_id)} yet.")
 else:
     st.info("No processed reports yet — upload one below to populate the dashboard.")
 
@@ -97,20 +127,15 @@ with col_left:
 
         def _handle_upload(patient_id: UUID, uploaded_file) -> None:
             """Callback wired to the upload panel's upload button."""
-            with st.spinner("Processing report…"):
-                result = handle_report_upload(
-                    patient_id=patient_id,
-                    file_bytes=uploaded_file.getvalue(),
-                    original_filename=uploaded_file.name,
-                )
-            if result.success:
-                st.success(
-                    f"✅ Processed! Found **{result.metrics_count}** metrics "
-                    f"and **{result.notes_count}** notes."
-                )
-                st.rerun()
-            else:
-                st.error(f"❌ {result.message}")
+            enqueue_report(
+                patient_id=patient_id,
+                file_bytes=uploaded_file.getvalue(),
+                original_filename=uploaded_file.name,
+            )
+            st.success(
+                "✅ Report queued! It will appear in **Active Report** "
+                "once processing completes."
+            )
 
         render_upload_panel(
             on_upload=_handle_upload,
@@ -7,8 +7,9 @@ UI logic uses shared components; business logic stays in controllers.
 import streamlit as st
 from datetime import date
 
-from app.db.connection import check_connection
-from app.controllers.report_controller import handle_create_patient, handle_report_upload
+from app.db.health import is_db_available
+from app.controllers.report_controller import handle_create_patient
+from app.services.job_queue import enqueue_report, list_recent_jobs
 from app.services.report_service import get_all_patients
 from app.ui.styles import inject_styles
 from app.ui.components.sidebar import render_sidebar
@@ -35,7 +36,7 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-if not check_connection():
+if not is_db_available():
     st.error("⚠️ Database is not connected. Configure `.env` and restart.")
     st.stop()
 
@@ -78,20 +79,39 @@ with tab_upload:
                 st.divider()
 
                 if st.button("🚀 Upload & Process", type="primary", use_container_width=True):
-                    with st.spinner("Extracting data from your report…"):
-                        result = handle_report_upload(
-                            patient_id=patient.id,
-                            file_bytes=file_bytes,
-                            original_filename=uploaded.name,
-                        )
-                    if result.success:
-                        st.success(f"✅ {result.message}")
+                    enqueue_report(
+                        patient_id=patient.id,
+                        file_bytes=file_bytes,
+                        original_filename=uploaded.name,
+                    )
+                    st.success("✅ Report queued — processing continues in the background.")
+
+        # ── Processing Jobs (read from the persistent queue) ──────────
+        jobs = list_recent_jobs(limit=10)
+        if jobs:
+            col_title, col_refresh = st.columns([5, 1])
+            col_title.markdown("#### ⏳ Recent Processing Jobs")
+            if col_refresh.button("🔄 Refresh", use_container_width=True, key="refresh_jobs"):
+                st.rerun()
+
+            patient_names = {str(p.id): p.full_name for p in patients}
+            STATUS_ICON = {"pending": "⏳", "processing": "🔄", "completed": "✅", "failed": "❌"}
+            for job in jobs:
+                icon = STATUS_ICON.get(job.status, "❓")
+                with st.container(border=True):
+                    st.write(
+                        f"{icon} **{job.original_filename}** · "
+                        f"{patient_names.get(job.patient_id, '?')} · {job.status.capitalize()}"
+                    )
+                    if job.status == "completed":
                         col_m1, col_m2 = st.columns(2)
-                        col_m1.metric("🔬 Metrics Found", result.metrics_count)
-                        col_m2.metric("📝 Notes Found",   result.notes_count)
-                        st.info(f"Report ID: `{result.report_id}`  — go to **View Reports** to inspect.")
+                        col_m1.metric("🔬 Metrics Found", job.metrics_count)
+                        col_m2.metric("📝 Notes Found",   job.notes_count)
+                        st.info(f"Report ID: `{job.report_id}`  — go to **View Reports** to inspect.")
+                    elif job.status == "failed":
+                        st.error(f"❌ {job.message}")
                     else:
-                        st.error(f"❌ {result.message}")
+                        st.caption(f"Job ID: `{job.id}`")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -7,11 +7,16 @@ Rendering delegated to the report_table component.
 import streamlit as st
 from uuid import UUID
 
-from app.db.connection import check_connection
-from app.services.report_service import get_all_reports, get_all_patients
+from app.db.health import is_db_available
+from app.db.models import ReportStatus
+from app.services.report_service import (
+    get_all_patients,
+    get_reports_page,
+    count_reports_by_status,
+)
 from app.ui.styles import inject_styles
 from app.ui.components.sidebar import render_sidebar
-from app.ui.components.report_table import render_report_row, render_report_summary_metrics
+from app.ui.components.report_table import render_report_row, render_report_status_counts
 
 
 st.set_page_config(
@@ -34,15 +39,14 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-if not check_connection():
+if not is_db_available():
     st.error("⚠️ Database is not connected.")
     st.stop()
 
 # ── Filters ───────────────────────────────────────────────────────────────────
 patients = get_all_patients()
-patient_name_map = {p.id: p.full_name for p in patients}
 
-col_f1, col_f2, col_refresh = st.columns([3, 2, 1])
+col_f1, col_f2, col_from, col_to, col_size, col_refresh = st.columns([3, 2, 2, 2, 1, 1])
 
 with col_f1:
     patient_options = {"All Patients": None}
@@ -53,6 +57,15 @@ with col_f1:
 with col_f2:
     filter_status = st.selectbox("Status", ["All", "completed", "pending", "processing", "failed"])
 
+with col_from:
+    filter_from = st.date_input("From", value=None)
+
+with col_to:
+    filter_to = st.date_input("To", value=None)
+
+with col_size:
+    page_size = st.selectbox("Per page", [10, 25, 50, 100], index=1)
+
 with col_refresh:
     st.write("")
     if st.button("🔄 Refresh", use_container_width=True):
@@ -60,20 +73,38 @@ with col_refresh:
 
 st.divider()
 
-# ── Fetch & Filter ────────────────────────────────────────────────────────────
-all_reports = get_all_reports()
+# ── Pagination State ──────────────────────────────────────────────────────────
+# Keyset pagination: a stack of cursors for the pages visited so far.
+# Any filter change starts again from the first page.
+status_filter = ReportStatus(filter_status) if filter_status != "All" else None
+filter_key = (filter_patient_id, filter_status, filter_from, filter_to, page_size)
 
-if filter_patient_id:
-    all_reports = [r for r in all_reports if r.patient_id == filter_patient_id]
-if filter_status != "All":
-    all_reports = [r for r in all_reports if r.status.value == filter_status]
+if st.session_state.get("reports_filter_key") != filter_key:
+    st.session_state["reports_filter_key"] = filter_key
+    st.session_state["reports_cursors"] = [None]
+
+cursors: list = st.session_state["reports_cursors"]
 
 # ── Summary Metrics ───────────────────────────────────────────────────────────
-render_report_summary_metrics(all_reports)
+render_report_status_counts(
+    count_reports_by_status(
+        patient_id=filter_patient_id, date_from=filter_from, date_to=filter_to
+    )
+)
 st.divider()
 
+# ── Fetch One Page ────────────────────────────────────────────────────────────
+page = get_reports_page(
+    patient_id=filter_patient_id,
+    status=status_filter,
+    date_from=filter_from,
+    date_to=filter_to,
+    cursor=cursors[-1],
+    page_size=page_size,
+)
+
 # ── Report Rows ───────────────────────────────────────────────────────────────
-if not all_reports:
+if not page.items:
     st.info("No reports found. Upload one from the **Upload Report** page.")
 else:
 
@@ -81,6 +112,24 @@ else:
         st.session_state["view_report_id"] = str(report_id)
         st.switch_page("pages/4_Extracted_Data.py")
 
-    for report in all_reports:
-        name = patient_name_map.get(report.patient_id, "Unknown")
-        render_report_row(report, patient_name=name, on_view=_go_to_extracted)
\ No newline at end of file
+    for report, name in page.items:
+        render_report_row(report, patient_name=name or "Unknown", on_view=_go_to_extracted)
+
+# ── Page Navigation ───────────────────────────────────────────────────────────
+col_prev, col_page, col_next = st.columns([2, 3, 2])
+
+with col_prev:
+    if st.button("◀ Previous", disabled=len(cursors) <= 1, use_container_width=True):
+        cursors.pop()
+        st.rerun()
+
+with col_page:
+    st.markdown(
+        f'<div style="text-align:center;padding:6px 0;">Page {len(cursors)}</div>',
+        unsafe_allow_html=True,
+    )
+
+with col_next:
+    if st.button("Next ▶", disabled=page.next_cursor is None, use_container_width=True):
+        cursors.append(page.next_cursor)
+        st.rerun()
\ No newline at end of file
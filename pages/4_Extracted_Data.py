@@ -8,7 +8,7 @@ import streamlit as st
 import pandas as pd
 from uuid import UUID
 
-from app.db.connection import check_connection
+from app.db.health import is_db_available
 from app.services.report_service import (
     get_report_by_id,
     get_extracted_data,
@@ -42,7 +42,7 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-if not check_connection():
+if not is_db_available():
     st.error("⚠️ Database is not connected.")
     st.stop()
 
@@ -0,0 +1,130 @@
+"""
+Equivalence tests for the single-pass metric scanner.
+
+The combined scanner (lookbehind + per-pattern lookaheads, start-class
+prefilter) and the short-text per-pattern path must both return exactly what
+scanning METRIC_PATTERNS one regex at a time returns: first usable match per
+metric_key, in pattern order.
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from app.core import data_extractor
+from app.core.data_extractor import METRIC_PATTERNS, extract_metrics
+from app.utils.text_utils import extract_numeric_value, truncate
+from benchmarks.corpus import CorpusConfig, generate_corpus
+
+
+FRAGMENTS = [
+    "glucose: 95 mg/dL", "Fasting Blood Sugar - 132", "FBS .", "FPG 5.4 mmol/L",
+    "PP blood sugar 150", "post-prandial glucose: 210", "random BS 99",
+    "HbA1c 6.1%", "Hemoglobin A1c: 7", "A1C .", "Hb 13", "Hgb: 11.2 g/dl",
+    "hemoglobin 14.5", "total cholesterol 210", "cholesterol: 180 mg/dL",
+    "LDL: 130", "LDL cholesterol 99 mg/dL", "HDL 45", "HDLcholesterol 61",
+    "triglyceride 160", "Triglycerides: 90 mg/dL", "BMI 27 kg/m2", "BMI: 22.5 kg/m²",
+    "BP 130/85 mmHg", "blood pressure 1.2.3/4", "BP: 118 / 76", "creatinine 1.0",
+    "uric acid 5", "TSH (serum) 2.1", "TSH 3.2 mIU/L", "TSH (3rd gen) :",
+    "vitamin D 18 ng/mL", "25-OH Vitamin D: 31", "vitamin B12 300", "B12 300",
+    "cobalamin 450 pg/mL", "sugar . 90", "random text", "value .. 12", "Notes:",
+    "\n", "\n\n", "-", ":", "/", "(", ")",
+]
+
+
+def _reference_metrics(text: str) -> list[tuple]:
+    """Baseline semantics: one re.finditer per pattern, first usable value wins."""
+    found = []
+    for metric_key, _name, pattern in METRIC_PATTERNS:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            raw_value = match.group(1) if match.lastindex and match.lastindex >= 1 else ""
+            value = extract_numeric_value(raw_value)
+            if value is None:
+                continue
+            found.append((metric_key, value, truncate(match.group(0), 120)))
+            break
+    return found
+
+
+def _scanned_metrics(text: str) -> list[tuple]:
+    metrics = extract_metrics(text)
+    return [(m.metric_key, m.value, m.raw_text_snippet) for m in metrics]
+
+
+def _random_text(rng: random.Random) -> str:
+    separators = (" ", "", "  ", "\n", "\t")
+    return "".join(
+        rng.choice(FRAGMENTS) + rng.choice(separators)
+        for _ in range(rng.randint(0, 40))
+    )
+
+
+def _assert_matches_reference(text: str) -> None:
+    assert _scanned_metrics(text) == _reference_metrics(text), text
+
+
+@pytest.fixture(params=["scanner", "per_pattern"])
+def scan_mode(request, monkeypatch):
+    """Run a test through the combined scanner and the short-text per-pattern path."""
+    threshold = 0 if request.param == "scanner" else 10**9
+    monkeypatch.setattr(data_extractor, "PER_PATTERN_MAX_CHARS", threshold)
+    return request.param
+
+
+def test_scanner_matches_per_pattern_scan(scan_mode):
+    rng = random.Random(20240501)
+    for _ in range(5000):
+        _assert_matches_reference(_random_text(rng))
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "BP 130/85 mmHg",                       # overlapping systolic / diastolic
+    "Hb . Hb 12",                           # rejected match, later usable one
+    "HbA1c 6.1% Hb 13",                     # HbA1c must not count as hemoglobin
+    "glucose . glucose 95 sugar 80",
+    "TSH (high) 5.6 mIU/L",
+])
+def test_scanner_edge_cases(scan_mode, text):
+    _assert_matches_reference(text)
+
+
+def test_scanner_without_start_class_prefilter(monkeypatch):
+    """The prefilter is an optimisation only; without the regex parser results are unchanged."""
+    monkeypatch.setattr(data_extractor, "PER_PATTERN_MAX_CHARS", 0)
+    monkeypatch.setattr(data_extractor, "sre_parse", None)
+    scanner, layout = data_extractor._compile_metric_scanner(METRIC_PATTERNS)
+    assert scanner.pattern.startswith(r"[\s\S]")
+
+    monkeypatch.setattr(data_extractor, "_METRIC_SCANNER", scanner)
+    monkeypatch.setattr(data_extractor, "_METRIC_LAYOUT", layout)
+    rng = random.Random(7)
+    for _ in range(500):
+        _assert_matches_reference(_random_text(rng))
+
+
+def _best_time(func, texts, repeats=5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("config", [
+    CorpusConfig(docs=100, pages=1, metrics_per_report=10),
+    CorpusConfig(docs=100, pages=2, metrics_per_report=10, noise=0.02),
+    CorpusConfig(docs=50, pages=8, metrics_per_report=14),
+    CorpusConfig(docs=50, pages=8, metrics_per_report=2),
+], ids=["1-page", "2-page-noisy", "8-page", "8-page-sparse"])
+def test_extract_metrics_throughput(config):
+    """extract_metrics must not fall behind the plain per-pattern scan it replaced."""
+    texts = [report.text for report in generate_corpus(config)]
+    extract_metrics(texts[0])  # warm the re module cache for the reference
+
+    ratio = _best_time(extract_metrics, texts) / _best_time(_reference_metrics, texts)
+    assert ratio < 1.5, f"extract_metrics is {ratio:.2f}x the per-pattern scan"
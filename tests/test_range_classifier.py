@@ -0,0 +1,97 @@
+"""
+Equivalence tests for the vectorized reference-range classifier.
+
+classify_values() with the default table must agree with
+data_extractor._compute_status() value for value: on every REFERENCE_RANGES
+boundary (including the ref_min = 0 ranges and the critical-factor
+thresholds), on random values, and for metrics without a range. Non-finite
+values are the one deliberate difference: they classify as unknown.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.data_extractor import (
+    CRITICAL_HIGH_FACTOR,
+    CRITICAL_LOW_FACTOR,
+    REFERENCE_RANGES,
+    _compute_status,
+)
+from app.core.range_classifier import classify_values, status_names
+
+
+def _expected(metric_key: str, value: float) -> str:
+    ref = REFERENCE_RANGES.get(metric_key)
+    return _compute_status(value, ref[0] if ref else None, ref[1] if ref else None)
+
+
+def _boundary_values(ref_min: float, ref_max: float) -> list[float]:
+    """Every threshold of _compute_status, plus the nearest floats on each side."""
+    thresholds = [
+        ref_min, ref_max,
+        ref_min * CRITICAL_LOW_FACTOR, ref_max * CRITICAL_HIGH_FACTOR,
+        0.0, -1.0,
+    ]
+    values = []
+    for t in thresholds:
+        values += [np.nextafter(t, -np.inf), t, np.nextafter(t, np.inf)]
+    return values
+
+
+def _assert_equivalent(keys: list[str], values: list[float]) -> None:
+    names = status_names(classify_values(keys, values))
+    expected = [_expected(k, v) for k, v in zip(keys, values)]
+    mismatches = [
+        (k, v, got, want)
+        for k, v, got, want in zip(keys, values, names, expected)
+        if got != want
+    ]
+    assert not mismatches, mismatches[:10]
+
+
+@pytest.mark.parametrize("metric_key", list(REFERENCE_RANGES))
+def test_reference_range_boundaries(metric_key):
+    ref_min, ref_max, _unit = REFERENCE_RANGES[metric_key]
+    values = _boundary_values(ref_min, ref_max)
+    _assert_equivalent([metric_key] * len(values), values)
+
+
+def test_zero_minimum_ranges_are_covered():
+    zero_min = [key for key, (ref_min, *_) in REFERENCE_RANGES.items() if ref_min == 0]
+    assert zero_min, "REFERENCE_RANGES no longer has a ref_min = 0 range to test"
+    values = [-1e-9, 0.0, 1e-9, -5.0]
+    keys = [key for key in zero_min for _ in values]
+    _assert_equivalent(keys, values * len(zero_min))
+
+
+def test_random_values_match_compute_status():
+    rng = np.random.default_rng(20240501)
+    keys = list(REFERENCE_RANGES) + ["not_a_metric"]
+    n = 50_000
+    sampled_keys = rng.choice(keys, n).tolist()
+    values = rng.uniform(-10, 1500, n).tolist()
+    _assert_equivalent(sampled_keys, values)
+
+
+def test_unknown_metric_keys():
+    keys = ["not_a_metric", "", "LDL"]
+    values = [50.0, 0.0, 120.0]
+    assert list(status_names(classify_values(keys, values))) == ["unknown"] * 3
+    _assert_equivalent(keys, values)
+
+
+def test_metric_keys_are_normalised():
+    values = [95.0, 250.0]
+    codes = classify_values([" Blood_Glucose_Fasting ", "TOTAL_CHOLESTEROL"], values)
+    expected = classify_values(["blood_glucose_fasting", "total_cholesterol"], values)
+    assert list(codes) == list(expected)
+
+
+@pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+def test_non_finite_values_are_unknown(value):
+    codes = classify_values(list(REFERENCE_RANGES), [value] * len(REFERENCE_RANGES))
+    assert set(status_names(codes)) == {"unknown"}
+
+
+def test_empty_input():
+    assert len(classify_values([], [])) == 0